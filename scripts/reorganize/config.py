@@ -13,31 +13,31 @@ from pathlib import Path
 # =============================================================================
 
 # Directories to skip during processing
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "generated",
     "__pycache__",
     ".git",
     "node_modules",
-}
+})
 
 # Files to skip (not processed)
-SKIP_FILES = {
+SKIP_FILES = frozenset({
     "books.json",
     "changelog.json",
     "converter.json",
-}
+})
 
 # File patterns to skip (fnmatch patterns)
-SKIP_PATTERNS = {
+SKIP_PATTERNS = frozenset({
     "foundry-*.json",
-}
+})
 
 # =============================================================================
 # Image Categories
 # =============================================================================
 
 # Image categories to process from /img/ directory
-IMAGE_CATEGORIES = {
+IMAGE_CATEGORIES = frozenset({
     "bestiary",
     "book",
     "items",
@@ -75,7 +75,7 @@ IMAGE_CATEGORIES = {
     "msbcr",
     "names",
     "bastions",
-}
+})
 
 # =============================================================================
 # Image Path Validation
@@ -134,13 +134,13 @@ IMAGE_PATH_SPECIAL_MAPPINGS = {
 
 # Sources that are known to use cross-source image references
 # These are intentional and should not be flagged as errors
-CROSS_SOURCE_IMAGE_SOURCES = {
+CROSS_SOURCE_IMAGE_SOURCES = frozenset({
     "HFFotM",  # References DMG, AAG, DoD images
     # Add more as discovered during audits
-}
+})
 
 # Image categories to validate
-IMAGE_PATH_CATEGORIES = {
+IMAGE_PATH_CATEGORIES = frozenset({
     "bestiary",
     "book",
     "adventure",
@@ -151,14 +151,14 @@ IMAGE_PATH_CATEGORIES = {
     "spells",
     "deities",
     "decks",  # For TD source
-}
+})
 
 # =============================================================================
 # JSON Entity Types
 # =============================================================================
 
 # JSON entity types (root keys) to process
-ENTITY_TYPES = {
+ENTITY_TYPES = frozenset({
     "background",
     "item",
     "monster",
@@ -184,11 +184,7 @@ ENTITY_TYPES = {
     "sense",
     "psionic",
     "action",
-    "skill",
-    "sense",
-    "language",
-    "vehicle",
-}
+})
 
 # =============================================================================
 # Fluff Files
@@ -205,12 +201,12 @@ FLUFF_ENTITY_PREFIX = "fluff"
 # =============================================================================
 
 # Subdirectories in /data/ that contain special JSON files
-SPECIAL_DATA_SUBDIRS = {
+SPECIAL_DATA_SUBDIRS = frozenset({
     "bestiary",   # Monster data files
     "class",      # Class data files
     "book",       # Book data files (content, sections, etc.)
     "adventure",  # Adventure data files
-}
+})
 
 # =============================================================================
 # Cross-Source Handling
@@ -270,7 +266,7 @@ LOG_FILE = "reorganization.log"
 
 # Sources with hyphens that are NOT submodules (they are independent sources)
 # These sources should be treated as regular sources, not split into base/submodule
-NOT_SUBMODULE_SOURCES = {
+NOT_SUBMODULE_SOURCES = frozenset({
     # Plane Shift aliases (PS-A is an alias for PSA, but won't be loaded)
     "PS-A",
     "PS-D",
@@ -280,7 +276,7 @@ NOT_SUBMODULE_SOURCES = {
     "PS-Z",
     # HAT-TG is an independent source (not a submodule of HAT)
     "HAT-TG",
-}
+})
 
 # =============================================================================
 # Performance Settings
@@ -367,6 +363,14 @@ SOURCE_GROUPS = {
     "organized-play": ["AL"],
 }
 
+# Reverse index: source ID -> group name (derived from SOURCE_GROUPS).
+# Lookups by source are O(1) instead of a linear scan over every group.
+SOURCE_TO_GROUP = {
+    source_id: group
+    for group, source_ids in SOURCE_GROUPS.items()
+    for source_id in source_ids
+}
+
 # =============================================================================
 # Metadata Settings
 # =============================================================================
@@ -7,27 +7,134 @@ This module provides a unified interface for copying files of different types
 """
 
 import logging
+import os
 import shutil
-from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Tuple
 
 from scripts.reorganize import config
 from scripts.reorganize.utils import (
     Statistics,
-    create_progress_iterator,
+    create_progress_bar,
     get_base_source,
+    get_image_path_component,
     get_submodule,
+    iter_files,
 )
 
 
+# =============================================================================
+# File Data Copy
+# =============================================================================
+
+def copy_file_data(source_file: Path, output_file: Path) -> None:
+    """
+    Copy file contents using the fastest available kernel path.
+
+    Tries os.copy_file_range first: on same-filesystem copies the kernel
+    moves the data without round-tripping through userspace, and
+    reflink-capable filesystems (btrfs, XFS) can share extents outright.
+    Falls back to shutil.copyfile (sendfile path) when the syscall is
+    unavailable or the copy crosses devices (EXDEV).
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_file, "rb") as fsrc, open(output_file, "wb") as fdst:
+                st = os.fstat(fsrc.fileno())
+                remaining = st.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                if remaining == 0:
+                    # Preserve mode and timestamps on the open descriptor:
+                    # two fd-based syscalls vs. copystat's stat+chmod+utime
+                    # path resolutions
+                    os.fchmod(fdst.fileno(), st.st_mode)
+                    os.utime(fdst.fileno(), ns=(st.st_atime_ns, st.st_mtime_ns))
+                    return
+        except OSError:
+            pass  # EXDEV / ENOSYS etc. — use the generic path below
+
+    shutil.copyfile(source_file, output_file)
+    shutil.copystat(source_file, output_file)
+
+
+# =============================================================================
+# Async Copy Engine
+# =============================================================================
+
+class AsyncCopyEngine:
+    """
+    Copy many files concurrently instead of one blocking call at a time.
+
+    File copying is fully I/O-bound, so pipelining many copies keeps the
+    disk queue full instead of stalling on each file in turn. Copies are
+    submitted to a thread pool in batches of ``config.BATCH_SIZE`` and
+    completions are collected with ``as_completed``.
+    """
+
+    __slots__ = ("max_workers",)
+
+    def __init__(self, max_workers: int = None):
+        """
+        Initialize the engine.
+
+        Args:
+            max_workers: Number of concurrent copies
+                (default: config.MAX_WORKERS * 4, I/O-bound workload)
+        """
+        self.max_workers = max_workers or config.MAX_WORKERS * 4
+
+    def copy_many(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        copy_fn: Callable[[Path, Path], bool],
+    ) -> int:
+        """
+        Copy a list of (source, destination) pairs concurrently.
+
+        Args:
+            pairs: List of (source_file, output_file) tuples
+            copy_fn: Callable performing a single copy, returns True on success
+
+        Returns:
+            Number of files copied successfully
+        """
+        if not pairs:
+            return 0
+
+        count = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Submit in batches to bound the number of queued futures
+            for start in range(0, len(pairs), config.BATCH_SIZE):
+                batch = pairs[start:start + config.BATCH_SIZE]
+                futures = [
+                    executor.submit(copy_fn, source_file, output_file)
+                    for source_file, output_file in batch
+                ]
+
+                for future in as_completed(futures):
+                    if future.result():
+                        count += 1
+
+        return count
+
+
 # =============================================================================
 # Base Copier Class
 # =============================================================================
 
-class BaseCopier(ABC):
+class BaseCopier:
     """Base class for copying files of any type."""
 
+    __slots__ = ("file_type", "source_dir_name", "output_subdir", "engine", "_created_dirs")
+
     def __init__(
         self,
         file_type: str,
@@ -45,23 +152,30 @@ class BaseCopier(ABC):
         self.file_type = file_type
         self.source_dir_name = source_dir_name
         self.output_subdir = output_subdir
+        self.engine = AsyncCopyEngine()
+        # Directories already created during this run; mkdir is a syscall
+        # per path component, so skip it for parents we have seen before
+        self._created_dirs: set = set()
+
+    def ensure_dir(self, directory: Path) -> None:
+        """Create a directory once per run, skipping already-created ones."""
+        key = str(directory)
+        if key not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(key)
 
-    @abstractmethod
     def get_source_dir(self, base_dir: Path, source_id: str) -> Path:
         """Get the path to the source directory for a given source."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_file_pattern(self) -> str:
         """Get the file pattern for searching (e.g., "*.pdf")."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def should_copy_file(self, source_file: Path, source_id: str) -> bool:
         """Determine if a file should be copied."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def get_output_path(
         self,
         source_file: Path,
@@ -69,12 +183,11 @@ class BaseCopier(ABC):
         source_id: str,
     ) -> Path:
         """Get the output path for copying a file."""
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def update_stats(self, stats: Statistics, source_id: str, count: int) -> None:
         """Update statistics with copy results."""
-        pass
+        raise NotImplementedError
 
     def copy_file(
         self,
@@ -83,6 +196,7 @@ class BaseCopier(ABC):
         source_id: str,
         stats: Statistics,
         log: logging.Logger,
+        ensure_parent: bool = True,
     ) -> bool:
         """
         Copy a single file with error handling.
@@ -93,13 +207,16 @@ class BaseCopier(ABC):
             source_id: Source ID
             stats: Statistics object
             log: Logger instance
+            ensure_parent: Create the parent directory (False when the
+                caller has already batch-created output directories)
 
         Returns:
             True if copy was successful, False otherwise
         """
         try:
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, output_file)
+            if ensure_parent:
+                self.ensure_dir(output_file.parent)
+            copy_file_data(source_file, output_file)
             log.debug(f"    Copied {self.file_type}: {source_file.name}")
             return True
         except Exception as e:
@@ -135,34 +252,54 @@ class BaseCopier(ABC):
             log.debug(f"    Source directory not found: {source_dir}")
             return 0
 
-        count = 0
-        file_pattern = self.get_file_pattern()
-
+        # Per-file failures are handled (and counted) inside copy_file, so
+        # only the directory listing and output-dir setup need guarding
+        # here — a single bad file must not abort the whole source.
         try:
-            files = list(source_dir.rglob(file_pattern))
-
-            if not files:
-                log.debug(f"    No {self.file_type} files found in {source_dir}")
-                return 0
-
-            log.debug(f"  📁 Copying {len(files)} {self.file_type} files for {source_id}...")
+            files = list(iter_files(source_dir))
+        except OSError as e:
+            error_msg = f"Failed to list {self.file_type}s for {source_id}: {e}"
+            log.error(error_msg)
+            stats.add_error(error_msg)
+            return 0
 
-            for source_file in files:
-                if not self.should_copy_file(source_file, source_id):
-                    continue
+        if not files:
+            log.debug(f"    No {self.file_type} files found in {source_dir}")
+            return 0
 
-                output_file = self.get_output_path(source_file, output_dir, source_id)
+        log.debug(f"  📁 Copying {len(files)} {self.file_type} files for {source_id}...")
 
-                if self.copy_file(source_file, output_file, source_id, stats, log):
-                    count += 1
+        # Collect (source, output) pairs, then copy them concurrently.
+        # Hoist the bound methods out of the per-file loop.
+        should_copy_file = self.should_copy_file
+        get_output_path = self.get_output_path
 
-            if count > 0:
-                log.debug(f"    ✓ Copied {count} {self.file_type} files for {source_id}")
+        pairs = [
+            (source_file, get_output_path(source_file, output_dir, source_id))
+            for source_file in files
+            if should_copy_file(source_file, source_id)
+        ]
 
-        except Exception as e:
-            error_msg = f"Failed to copy {self.file_type}s for {source_id}: {e}"
+        # Create each unique output directory once up front instead of
+        # calling mkdir per file inside the copy workers
+        try:
+            for parent in {output_file.parent for _, output_file in pairs}:
+                self.ensure_dir(parent)
+        except OSError as e:
+            error_msg = f"Failed to create output directories for {source_id}: {e}"
             log.error(error_msg)
             stats.add_error(error_msg)
+            return 0
+
+        count = self.engine.copy_many(
+            pairs,
+            lambda source_file, output_file: self.copy_file(
+                source_file, output_file, source_id, stats, log, ensure_parent=False
+            ),
+        )
+
+        if count > 0:
+            log.debug(f"    ✓ Copied {count} {self.file_type} files for {source_id}")
 
         return count
 
@@ -188,18 +325,37 @@ class BaseCopier(ABC):
 
         total_count = 0
 
-        for source_id, source_data in create_progress_iterator(
-            sources.items(),
-            desc=f"Copying {self.file_type}s",
-        ):
-            count = self.copy_for_source(source_id, base_dir, output_dir, stats, log)
-            self.update_stats(stats, source_id, count)
-
-            # Handle both int and dict return types
-            if isinstance(count, dict):
-                total_count += sum(count.values())
-            else:
-                total_count += count
+        def copy_source(source_id: str):
+            # Each worker accumulates into a private Statistics instance;
+            # they are merged on the consumer side to avoid any contention
+            # on the shared object.
+            local_stats = Statistics()
+            count = self.copy_for_source(source_id, base_dir, output_dir, local_stats, log)
+            return count, local_stats
+
+        # Sources are independent of each other, so copy them in parallel.
+        with ThreadPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(copy_source, source_id): source_id
+                for source_id in sources
+            }
+
+            with create_progress_bar(
+                total=len(futures),
+                desc=f"Copying {self.file_type}s",
+            ) as progress:
+                for future in as_completed(futures):
+                    source_id = futures[future]
+                    count, local_stats = future.result()
+                    stats.merge(local_stats)
+                    self.update_stats(stats, source_id, count)
+                    progress.update()
+
+                    # Handle both int and dict return types
+                    if isinstance(count, dict):
+                        total_count += sum(count.values())
+                    else:
+                        total_count += count
 
         log.info(f"{self.file_type.capitalize()} copying complete: {total_count} files copied")
 
@@ -211,6 +367,8 @@ class BaseCopier(ABC):
 class PdfCopier(BaseCopier):
     """Copier for PDF files."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(file_type="pdf", source_dir_name="pdf", output_subdir="pdf")
 
@@ -246,6 +404,45 @@ class PdfCopier(BaseCopier):
             # Regular source: data_rework/PHB/pdf/PHB.pdf
             return output_dir / base_source / "pdf" / source_file.name
 
+    def copy_for_source(
+        self,
+        source_id: str,
+        base_dir: Path,
+        output_dir: Path,
+        stats: Statistics,
+        log: logging.Logger,
+    ) -> int:
+        """
+        Copy the PDF for a single source.
+
+        Each source maps to exactly one known PDF path, so the directory
+        walk is skipped entirely: the file is stat'ed and copied directly.
+        (Walking the file path also silently found nothing, like rglob on
+        a non-directory.)
+
+        Args:
+            source_id: Source ID (e.g., "PHB")
+            base_dir: Base directory (e.g., /img/)
+            output_dir: Output directory (e.g., /data_rework/)
+            stats: Statistics object
+            log: Logger instance
+
+        Returns:
+            Number of files copied (0 or 1)
+        """
+        source_file = self.get_source_dir(base_dir, source_id)
+
+        if not source_file.is_file():
+            log.debug(f"    PDF not found: {source_file}")
+            return 0
+
+        output_file = self.get_output_path(source_file, output_dir, source_id)
+
+        if self.copy_file(source_file, output_file, source_id, stats, log):
+            log.debug(f"    ✓ Copied PDF for {source_id}")
+            return 1
+        return 0
+
     def update_stats(self, stats: Statistics, source_id: str, count: int) -> None:
         """Update statistics with PDF count."""
         stats.add_pdf_count(source_id, count)
@@ -255,11 +452,25 @@ class PdfCopier(BaseCopier):
 # Image Copier
 # =============================================================================
 
+# Image extensions to copy (lowercase, with dot)
+_IMG_SUFFIXES = (".webp", ".png", ".jpg", ".jpeg")
+
+
+def _is_image_name(name: str) -> bool:
+    """Check a filename's extension without building a Path."""
+    # str.endswith with a tuple checks all suffixes in one C call
+    return name.lower().endswith(_IMG_SUFFIXES)
+
+
 class ImageCopier(BaseCopier):
     """Copier for image files."""
 
+    __slots__ = ("_source_dirs",)
+
     def __init__(self):
         super().__init__(file_type="image", source_dir_name="img", output_subdir="img")
+        # Cache per-source directory lookups (constant for a given source)
+        self._source_dirs: Dict[str, Path] = {}
 
     def get_source_dir(self, base_dir: Path, source_id: str) -> Path:
         """
@@ -267,19 +478,8 @@ class ImageCopier(BaseCopier):
 
         Uses IMAGE_PATH_SPECIAL_MAPPINGS for sources like PS-A -> PSA.
         """
-        base_source = get_base_source(source_id)
-        submodule = get_submodule(source_id)
-
-        if submodule:
-            # Submodule: img/AitFR/DN/
-            path_component = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(
-                source_id, f"{base_source}/{submodule}"
-            )
-        else:
-            # Regular source: img/PHB/
-            path_component = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(source_id, base_source)
-
-        return base_dir / path_component
+        # e.g. img/PHB/ or img/AitFR/DN/
+        return base_dir / get_image_path_component(source_id)
 
     def get_file_pattern(self) -> str:
         """Get image file pattern."""
@@ -287,12 +487,15 @@ class ImageCopier(BaseCopier):
 
     def should_copy_file(self, source_file: Path, source_id: str) -> bool:
         """Check if file is an image."""
-        return source_file.suffix in [".webp", ".png", ".jpg", ".jpeg"]
+        return _is_image_name(source_file.name)
 
     def get_output_path(self, source_file: Path, output_dir: Path, source_id: str) -> Path:
         """Get output path for image file, preserving subdirectory structure."""
-        # Get the relative path from the source directory
-        source_dir = self.get_source_dir(Path("/img"), source_id)
+        # Get the relative path from the source directory (cached per source)
+        source_dir = self._source_dirs.get(source_id)
+        if source_dir is None:
+            source_dir = self.get_source_dir(Path("/img"), source_id)
+            self._source_dirs[source_id] = source_dir
         rel_path = source_file.relative_to(source_dir)
 
         base_source = get_base_source(source_id)
@@ -328,21 +531,36 @@ class ImageCopier(BaseCopier):
         """
         category_counts = {}
 
+        # Resolve the per-source path pieces once; they are constant for
+        # every category and image below.
+        base_source = get_base_source(source_id)
+        submodule = get_submodule(source_id)
+        path_component = get_image_path_component(source_id)
+
+        if submodule:
+            # Submodule: data_rework/AitFR/DN/img/
+            output_img_dir = output_dir / base_source / submodule / "img"
+        else:
+            # Regular source: data_rework/PHB/img/
+            output_img_dir = output_dir / base_source / "img"
+
         # 1. Copy cover images
-        cover_count = self._copy_cover_images(source_id, base_dir, output_dir, stats, log)
+        cover_count = self._copy_cover_images(source_id, base_dir, output_img_dir, stats, log)
         if cover_count > 0:
             category_counts["covers"] = cover_count
 
         # 2. Copy category images
         for category in config.IMAGE_CATEGORIES:
             count = self._copy_category_images(
-                source_id, category, base_dir, output_dir, stats, log
+                source_id, category, path_component, base_dir, output_img_dir, stats, log
             )
             if count > 0:
                 category_counts[category] = count
 
         # 3. Copy token images
-        token_count = self._copy_token_images(source_id, base_dir, output_dir, stats, log)
+        token_count = self._copy_token_images(
+            source_id, path_component, base_dir, output_img_dir, stats, log
+        )
         if token_count > 0:
             category_counts["tokens"] = token_count
 
@@ -359,29 +577,63 @@ class ImageCopier(BaseCopier):
         else:
             stats.add_image_stats(source_id, {"total": count})
 
+    def _copy_tree(
+        self,
+        source_dir: Path,
+        output_dir: Path,
+        source_id: str,
+        stats: Statistics,
+        log: logging.Logger,
+    ) -> int:
+        """
+        Copy all matching images under a directory, preserving structure.
+
+        Pairs are collected first and then handed to the shared copy
+        engine, so the per-file copies overlap instead of blocking one
+        at a time.
+        """
+        # Destination paths are built by string concatenation: the source
+        # prefix is constant for the whole tree, so slicing it off is much
+        # cheaper than Path.relative_to / Path.__truediv__ per file.
+        src_prefix_len = len(str(source_dir)) + len(os.sep)
+        out_prefix = str(output_dir) + os.sep
+
+        pairs = [
+            (item, Path(out_prefix + str(item)[src_prefix_len:]))
+            for item in iter_files(source_dir)
+            if self.should_copy_file(item, source_id)
+        ]
+
+        # Create each unique output directory once up front
+        for parent in {output_file.parent for _, output_file in pairs}:
+            self.ensure_dir(parent)
+
+        return self.engine.copy_many(
+            pairs,
+            lambda source_file, output_file: self.copy_file(
+                source_file, output_file, source_id, stats, log, ensure_parent=False
+            ),
+        )
+
     def _copy_cover_images(
         self,
         source_id: str,
         img_dir: Path,
-        output_dir: Path,
+        output_img_dir: Path,
         stats: Statistics,
         log: logging.Logger,
     ) -> int:
         """Copy cover images for a source."""
         cover_file = img_dir / "covers" / f"{source_id}.webp"
 
-        if not cover_file.exists():
+        # One lstat instead of the exists() probe; most sources miss here
+        try:
+            os.lstat(cover_file)
+        except OSError:
             return 0
 
-        base_source = get_base_source(source_id)
-        submodule = get_submodule(source_id)
-
-        if submodule:
-            # Submodule: data_rework/AitFR/DN/img/covers/...
-            output_file = output_dir / base_source / submodule / "img" / "covers" / cover_file.name
-        else:
-            # Regular source: data_rework/PHB/img/covers/...
-            output_file = output_dir / base_source / "img" / "covers" / cover_file.name
+        # e.g. data_rework/PHB/img/covers/...
+        output_file = output_img_dir / "covers" / cover_file.name
 
         if self.copy_file(cover_file, output_file, source_id, stats, log):
             return 1
@@ -391,46 +643,23 @@ class ImageCopier(BaseCopier):
         self,
         source_id: str,
         category: str,
+        path_component: str,
         img_dir: Path,
-        output_dir: Path,
+        output_img_dir: Path,
         stats: Statistics,
         log: logging.Logger,
     ) -> int:
         """Copy images for a specific category."""
-        base_source = get_base_source(source_id)
-        submodule = get_submodule(source_id)
-
-        if submodule:
-            # Submodule: img/bestiary/AitFR/DN/
-            path_component = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(
-                source_id, f"{base_source}/{submodule}"
-            )
-        else:
-            # Regular source: img/bestiary/PHB/
-            path_component = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(source_id, base_source)
-
+        # e.g. img/bestiary/PHB/ or img/bestiary/AitFR/DN/
         source_cat_dir = img_dir / category / path_component
 
         if not source_cat_dir.exists():
             return 0
 
-        if submodule:
-            # Submodule: data_rework/AitFR/DN/img/category/...
-            output_cat_dir = output_dir / base_source / submodule / "img" / category / path_component
-        else:
-            # Regular source: data_rework/PHB/img/category/...
-            output_cat_dir = output_dir / base_source / "img" / category / path_component
-
-        output_cat_dir.mkdir(parents=True, exist_ok=True)
-
-        count = 0
-        for item in source_cat_dir.rglob("*"):
-            if item.is_file() and self.should_copy_file(item, source_id):
-                rel_path = item.relative_to(source_cat_dir)
-                output_file = output_cat_dir / rel_path
+        # e.g. data_rework/PHB/img/category/...
+        output_cat_dir = output_img_dir / category / path_component
 
-                if self.copy_file(item, output_file, source_id, stats, log):
-                    count += 1
+        count = self._copy_tree(source_cat_dir, output_cat_dir, source_id, stats, log)
 
         if count > 0:
             log.debug(f"    Copied {count} {category} images")
@@ -440,46 +669,23 @@ class ImageCopier(BaseCopier):
     def _copy_token_images(
         self,
         source_id: str,
+        path_component: str,
         img_dir: Path,
-        output_dir: Path,
+        output_img_dir: Path,
         stats: Statistics,
         log: logging.Logger,
     ) -> int:
         """Copy token images for a source."""
-        base_source = get_base_source(source_id)
-        submodule = get_submodule(source_id)
-
-        if submodule:
-            # Submodule: img/bestiary/tokens/AitFR/DN/
-            path_component = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(
-                source_id, f"{base_source}/{submodule}"
-            )
-        else:
-            # Regular source: img/bestiary/tokens/PHB/
-            path_component = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(source_id, base_source)
-
+        # e.g. img/bestiary/tokens/PHB/ or img/bestiary/tokens/AitFR/DN/
         source_tokens_dir = img_dir / "bestiary" / "tokens" / path_component
 
         if not source_tokens_dir.exists():
             return 0
 
-        if submodule:
-            # Submodule: data_rework/AitFR/DN/img/bestiary/tokens/...
-            output_tokens_dir = output_dir / base_source / submodule / "img" / "bestiary" / "tokens" / path_component
-        else:
-            # Regular source: data_rework/PHB/img/bestiary/tokens/...
-            output_tokens_dir = output_dir / base_source / "img" / "bestiary" / "tokens" / path_component
-
-        output_tokens_dir.mkdir(parents=True, exist_ok=True)
-
-        count = 0
-        for item in source_tokens_dir.rglob("*"):
-            if item.is_file() and self.should_copy_file(item, source_id):
-                rel_path = item.relative_to(source_tokens_dir)
-                output_file = output_tokens_dir / rel_path
+        # e.g. data_rework/PHB/img/bestiary/tokens/...
+        output_tokens_dir = output_img_dir / "bestiary" / "tokens" / path_component
 
-                if self.copy_file(item, output_file, source_id, stats, log):
-                    count += 1
+        count = self._copy_tree(source_tokens_dir, output_tokens_dir, source_id, stats, log)
 
         if count > 0:
             log.debug(f"    Copied {count} token images")
@@ -6,6 +6,9 @@ This module handles the processing and splitting of JSON files by source.
 """
 
 import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -14,7 +17,6 @@ from scripts.reorganize.utils import (
     Statistics,
     create_progress_iterator,
     deduplicate_entities,
-    extract_entities_from_json,
     get_base_source,
     get_entity_source,
     get_submodule,
@@ -24,6 +26,191 @@ from scripts.reorganize.utils import (
     should_skip_file,
 )
 
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+# =============================================================================
+# Directory Creation Cache
+# =============================================================================
+
+# Output directories already created this run. mkdir(parents=True) costs
+# a stat plus mkdir per path component, and the same data/ directories
+# recur for every input file, so each is created at most once.
+_ensured_dirs: Set[str] = set()
+
+
+def _ensure_dir(dir_path: Path) -> None:
+    """Create an output directory once per run, skipping known ones."""
+    key = str(dir_path)
+    if key not in _ensured_dirs:
+        dir_path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+
+# =============================================================================
+# Directory Listing
+# =============================================================================
+
+def _list_json_files(dir_path: Path, prefix: str = "") -> List[Path]:
+    """
+    List JSON files in a directory, optionally filtered by name prefix.
+
+    Uses os.scandir instead of Path.glob: DirEntry serves the file-type
+    check from the directory read itself, so no per-entry stat or
+    fnmatch work is done.
+
+    Args:
+        dir_path: Directory to list (not recursive)
+        prefix: Required filename prefix (e.g. "bestiary-")
+
+    Returns:
+        List of matching file paths
+    """
+    with os.scandir(dir_path) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and entry.name.endswith(".json")
+            and entry.name.startswith(prefix)
+        ]
+
+
+def _scan_data_dir(data_dir: Path) -> Tuple[List[Path], List[Path]]:
+    """
+    Partition data/*.json into main and fluff files in one directory read.
+
+    The main-file and fluff-file listings previously scanned the same
+    directory twice; one scandir pass splits on the fluff- prefix and
+    applies the skip rules to the main set.
+
+    Args:
+        data_dir: Path to /data/ directory
+
+    Returns:
+        (main_json_files, fluff_files)
+    """
+    main_files: List[Path] = []
+    fluff_files: List[Path] = []
+
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False) or not entry.name.endswith(".json"):
+                continue
+            if entry.name.startswith("fluff-"):
+                fluff_files.append(Path(entry.path))
+            elif not should_skip_file(entry.name, config.SKIP_FILES, config.SKIP_PATTERNS):
+                main_files.append(Path(entry.path))
+
+    return main_files, fluff_files
+
+
+# =============================================================================
+# Bestiary Loading
+# =============================================================================
+
+# Files above this size are streamed with ijson instead of fully parsed
+_BESTIARY_STREAM_THRESHOLD = 5_000_000
+
+
+def _iter_bestiary_monsters(
+    json_file: Path,
+    log: logging.Logger,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load the monster array from a bestiary file.
+
+    Small files go through load_json as before. Files above the size
+    threshold are streamed with ijson when it is available, parsing only
+    the "monster" key: the top-level dict and any unrelated keys are
+    never instantiated as Python objects.
+
+    Args:
+        json_file: Path to a bestiary-*.json file
+        log: Logger instance
+
+    Returns:
+        List of monster dicts, or None if the file could not be loaded
+    """
+    if IJSON_AVAILABLE:
+        try:
+            if os.stat(json_file).st_size > _BESTIARY_STREAM_THRESHOLD:
+                with open(json_file, "rb") as f:
+                    return list(ijson.items(f, "monster.item", use_float=True))
+        except (OSError, ijson.JSONError) as e:
+            log.error(f"Error loading {json_file}: {e}")
+            return None
+
+    data = load_json(json_file, log)
+    if not data:
+        return None
+
+    monsters = data.get("monster")
+    return monsters if isinstance(monsters, list) else []
+
+
+# =============================================================================
+# Entity Extraction
+# =============================================================================
+
+def _extract_and_group_by_source(
+    data: Dict[str, Any],
+    entity_types: Optional[Set[str]],
+    log: logging.Logger,
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Extract entity arrays and group them by source in one traversal.
+
+    Fuses extract_entities_from_json with group_entities_by_source:
+    each entity is visited exactly once instead of being listed by the
+    extractor and re-walked by the grouper.
+
+    Args:
+        data: JSON data dict
+        entity_types: Set of entity type keys to extract (None = all)
+        log: Logger instance
+
+    Returns:
+        Dict mapping entity_type -> source_id -> entities
+    """
+    grouped: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+
+    for key, value in data.items():
+        # Skip _meta and other non-entity keys
+        if key.startswith("_"):
+            continue
+
+        if entity_types is not None and key not in entity_types:
+            continue
+
+        # Check if value is a list of entities
+        if not isinstance(value, list) or not value or not isinstance(value[0], dict):
+            continue
+
+        by_source: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        missing_source = 0
+
+        for entity in value:
+            source = get_entity_source(entity)
+            if source:
+                by_source[source].append(entity)
+            else:
+                missing_source += 1
+
+        if missing_source:
+            log.warning(
+                f"Found {missing_source} {key} entities without source field"
+            )
+
+        grouped[key] = by_source
+
+    return grouped
+
 
 # =============================================================================
 # JSON File Processing
@@ -64,30 +251,32 @@ def process_json_file(
         stats.add_error(f"Failed to load {json_path}")
         return {}
 
-    # Extract entities from JSON
-    entity_arrays = extract_entities_from_json(
+    # Extract entities and group them by source in one pass
+    entity_groups = _extract_and_group_by_source(
         data,
         entity_types=config.ENTITY_TYPES,
-        logger=log,
+        log=log,
     )
 
-    if not entity_arrays:
+    if not entity_groups:
         log.debug(f"No entity arrays found in {json_path.name}")
         return {}
 
     # Track output filename
     output_filename = json_path.name
 
-    # Process each entity type
-    counts_per_source = {}
+    # Accumulate all entity types per source, then write each source's
+    # file exactly once. Writing inside the entity-type loop serialized
+    # the same file repeatedly — and each write clobbered the entity
+    # types saved before it.
+    outputs: Dict[str, Dict[str, Any]] = {}
 
-    for entity_type, entities in entity_arrays:
-        log.debug(f"Processing {len(entities)} {entity_type} entities...")
+    # Same _meta object for every source; look it up once
+    meta = data.get("_meta")
 
-        # Group by source
-        grouped = group_entities_by_source(entities, entity_type, log)
+    for entity_type, grouped in entity_groups.items():
+        log.debug(f"Processing {entity_type} entities...")
 
-        # Save each source's entities
         for source_id, source_entities in grouped.items():
             if source_id not in sources:
                 log.warning(f"❌ Unknown source '{source_id}' in {json_path.name}, skipping")
@@ -97,43 +286,42 @@ def process_json_file(
 
             log.debug(f"✓ Found {len(source_entities)} entities for source '{source_id}'")
 
-            # Create output directory
-            base_source = get_base_source(source_id)
-            submodule = get_submodule(source_id)
+            output_data = outputs.get(source_id)
+            if output_data is None:
+                # Build output data (preserve _meta and structure)
+                output_data = {} if meta is None else {"_meta": meta}
+                outputs[source_id] = output_data
 
-            if submodule:
-                # Submodule: data_rework/AitFR/DN/data/
-                source_output_dir = output_dir / base_source / submodule / "data"
-            else:
-                # Regular source: data_rework/PHB/data/
-                source_output_dir = output_dir / base_source / "data"
+            # Add entities for this source
+            output_data[entity_type] = source_entities
 
-            source_output_dir.mkdir(parents=True, exist_ok=True)
+    # Save each source's accumulated data
+    counts_per_source = {}
 
-            # Build output data (preserve _meta and structure)
-            output_data = {}
+    for source_id, output_data in outputs.items():
+        # Create output directory
+        base_source = get_base_source(source_id)
+        submodule = get_submodule(source_id)
 
-            # Copy _meta if present
-            if "_meta" in data:
-                output_data["_meta"] = data["_meta"]
+        if submodule:
+            # Submodule: data_rework/AitFR/DN/data/
+            source_output_dir = output_dir / base_source / submodule / "data"
+        else:
+            # Regular source: data_rework/PHB/data/
+            source_output_dir = output_dir / base_source / "data"
 
-            # Add entities for this source
-            output_data[entity_type] = source_entities
+        _ensure_dir(source_output_dir)
 
-            # Save to file
-            output_file = source_output_dir / output_filename
-            if save_json(output_data, output_file, log):
-                # Update counts
-                if source_id not in counts_per_source:
-                    counts_per_source[source_id] = 0
-                counts_per_source[source_id] += len(source_entities)
-
-                log.debug(
-                    f"  Saved {len(source_entities)} {entity_type} entities "
-                    f"to {output_file.relative_to(output_dir)}"
-                )
-            else:
-                stats.add_error(f"Failed to save {output_file}")
+        entity_count = sum(
+            len(v) for k, v in output_data.items() if k != "_meta"
+        )
+
+        output_file = source_output_dir / output_filename
+        if save_json(output_data, output_file, log):
+            counts_per_source[source_id] = entity_count
+            log.debug("  Saved %d entities to %s", entity_count, output_file)
+        else:
+            stats.add_error(f"Failed to save {output_file}")
 
     log.info(f"  Processed {json_path.name}: {sum(counts_per_source.values())} entities from {len(counts_per_source)} sources")
 
@@ -169,7 +357,7 @@ def process_bestiary_files(
         return {}
 
     # Find all bestiary JSON files
-    json_files = list(bestiary_dir.glob("bestiary-*.json"))
+    json_files = _list_json_files(bestiary_dir, "bestiary-")
 
     if not json_files:
         log.warning(f"No bestiary files found in {bestiary_dir}")
@@ -177,25 +365,33 @@ def process_bestiary_files(
 
     log.info(f"Found {len(json_files)} bestiary files")
 
-    # Collect all monsters from all files
-    all_monsters = []
+    # Group monsters by source while loading, instead of materializing a
+    # combined list of every monster and re-walking it afterwards
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    total_loaded = 0
+    missing_source = 0
 
     for json_file in create_progress_iterator(
         json_files,
         desc="Loading bestiary files",
     ):
-        data = load_json(json_file, log)
-        if not data:
+        monsters = _iter_bestiary_monsters(json_file, log)
+        if monsters is None:
             stats.add_error(f"Failed to load {json_file}")
             continue
 
-        if "monster" in data and isinstance(data["monster"], list):
-            all_monsters.extend(data["monster"])
+        for monster in monsters:
+            total_loaded += 1
+            source = get_entity_source(monster)
+            if source:
+                grouped[source].append(monster)
+            else:
+                missing_source += 1
 
-    log.info(f"Loaded {len(all_monsters)} monsters total")
+    log.info(f"Loaded {total_loaded} monsters total")
 
-    # Group by source
-    grouped = group_entities_by_source(all_monsters, "monster", log)
+    if missing_source:
+        log.warning(f"Found {missing_source} monster entities without source field")
 
     # Save each source's monsters
     counts_per_source = {}
@@ -216,7 +412,7 @@ def process_bestiary_files(
             # Regular source: data_rework/PHB/data/
             source_output_dir = output_dir / base_source / "data"
 
-        source_output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(source_output_dir)
 
         # Build output data
         output_data = {"monster": monsters}
@@ -225,10 +421,7 @@ def process_bestiary_files(
         output_file = source_output_dir / "bestiary.json"
         if save_json(output_data, output_file, log):
             counts_per_source[source_id] = len(monsters)
-            log.debug(
-                f"  Saved {len(monsters)} monsters to "
-                f"{output_file.relative_to(output_dir)}"
-            )
+            log.debug("  Saved %d monsters to %s", len(monsters), output_file)
 
     log.info(
         f"Processed bestiary: {sum(counts_per_source.values())} monsters "
@@ -269,7 +462,7 @@ def process_class_files(
 		return {}
 
 	# Find all class JSON files
-	json_files = list(class_dir.glob("class-*.json"))
+	json_files = _list_json_files(class_dir, "class-")
 
 	if not json_files:
 		log.warning(f"No class files found in {class_dir}")
@@ -278,7 +471,7 @@ def process_class_files(
 	log.info(f"Found {len(json_files)} class files")
 
 	# Collect all class data from all files
-	all_class_data = {}
+	all_class_data: Dict[str, List[Any]] = defaultdict(list)
 
 	for json_file in create_progress_iterator(
 		json_files,
@@ -294,11 +487,7 @@ def process_class_files(
 			if key == "_meta":
 				continue
 
-			if key not in all_class_data:
-				all_class_data[key] = []
-
-			if isinstance(value, list):
-				all_class_data[key].extend(value)
+			all_class_data[key].extend(value if isinstance(value, list) else ())
 
 	# Step 1: Deduplicate and group each entity type by source
 	grouped_by_type_and_source = {}
@@ -330,12 +519,10 @@ def process_class_files(
 		log.debug(f"Processing {source_id}: {len(classes)} classes, {len(subclasses)} subclasses, {len(subclass_features)} features")
 
 		# Build feature map: {subclassShortName: [features]}
-		feature_map = {}
+		feature_map: Dict[str, List[Any]] = defaultdict(list)
 		for sf in subclass_features:
 			subclass_short_name = sf.get("subclassShortName")
 			if subclass_short_name:
-				if subclass_short_name not in feature_map:
-					feature_map[subclass_short_name] = []
 				feature_map[subclass_short_name].append(sf)
 
 		# Build subclass map and link features
@@ -377,11 +564,11 @@ def process_class_files(
 			# Regular source: data_rework/PHB/data/
 			source_output_dir = output_dir / base_source / "data"
 
-		source_output_dir.mkdir(parents=True, exist_ok=True)
+		_ensure_dir(source_output_dir)
 
 		# Create classes subdirectory
 		classes_output_dir = source_output_dir / "classes"
-		classes_output_dir.mkdir(parents=True, exist_ok=True)
+		_ensure_dir(classes_output_dir)
 
 		# Save each class to its own file
 		saved_count = 0
@@ -436,7 +623,7 @@ def process_book_files(
         return {}
 
     # Find all book JSON files
-    json_files = list(book_dir.glob("book-*.json"))
+    json_files = _list_json_files(book_dir, "book-")
 
     if not json_files:
         log.warning(f"No book files found in {book_dir}")
@@ -486,7 +673,7 @@ def process_book_files(
             # Regular source: data_rework/PHB/data/
             source_output_dir = output_dir / base_source / "data"
 
-        source_output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(source_output_dir)
 
         # Save to book.json in the source directory
         output_file = source_output_dir / "book.json"
@@ -497,10 +684,7 @@ def process_book_files(
                 entry_count = len(data["data"])
 
             counts_per_source[source_id] = entry_count
-            log.debug(
-                f"  Saved {entry_count} entries to "
-                f"{output_file.relative_to(output_dir)}"
-            )
+            log.debug("  Saved %d entries to %s", entry_count, output_file)
         else:
             stats.add_error(f"Failed to save {output_file}")
 
@@ -544,7 +728,7 @@ def process_spells_files(
         return {}
 
     # Find all spells JSON files
-    json_files = list(spells_dir.glob("spells-*.json"))
+    json_files = _list_json_files(spells_dir, "spells-")
 
     if not json_files:
         log.warning(f"No spells files found in {spells_dir}")
@@ -603,7 +787,7 @@ def process_spells_files(
             # Regular source: data_rework/PHB/data/
             source_output_dir = output_dir / base_source / "data"
 
-        source_output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(source_output_dir)
 
         # Save to spells.json in the source directory
         output_file = source_output_dir / "spells.json"
@@ -614,10 +798,7 @@ def process_spells_files(
                 spell_count = len(data["spell"])
 
             counts_per_source[source_id] = spell_count
-            log.debug(
-                f"  Saved {spell_count} spells to "
-                f"{output_file.relative_to(output_dir)}"
-            )
+            log.debug("  Saved %d spells to %s", spell_count, output_file)
         else:
             stats.add_error(f"Failed to save {output_file}")
 
@@ -635,6 +816,7 @@ def process_fluff_files(
     output_dir: Path,
     stats: Statistics,
     logger_instance: Optional[logging.Logger] = None,
+    fluff_files: Optional[List[Path]] = None,
 ) -> Dict[str, int]:
     """
     Process fluff JSON files and split by source.
@@ -645,6 +827,7 @@ def process_fluff_files(
         output_dir: Path to /data_rework/ directory
         stats: Statistics object to track results
         logger_instance: Optional logger instance
+        fluff_files: Pre-listed fluff files (skips re-scanning data_dir)
 
     Returns:
         Dict with counts per source
@@ -652,8 +835,9 @@ def process_fluff_files(
     log = logger_instance or logger
     log.info("Processing fluff files...")
 
-    # Find all fluff files
-    fluff_files = list(data_dir.glob("fluff-*.json"))
+    # Find all fluff files (unless the caller already scanned the dir)
+    if fluff_files is None:
+        fluff_files = _list_json_files(data_dir, "fluff-")
 
     if not fluff_files:
         log.warning("No fluff files found")
@@ -661,7 +845,7 @@ def process_fluff_files(
 
     log.info(f"Found {len(fluff_files)} fluff files")
 
-    counts_per_source = {}
+    counts_per_source: Dict[str, int] = defaultdict(int)
 
     for fluff_file in create_progress_iterator(
         fluff_files,
@@ -674,59 +858,66 @@ def process_fluff_files(
             stats.add_error(f"Failed to load {fluff_file}")
             continue
 
-        # Extract fluff arrays
-        entity_arrays = extract_entities_from_json(
+        # Extract fluff arrays and group them by source in one pass
+        entity_groups = _extract_and_group_by_source(
             data,
             entity_types=None,  # All types in fluff files
-            logger=log,
+            log=log,
         )
 
-        if not entity_arrays:
+        if not entity_groups:
             log.debug(f"No fluff entries found in {fluff_file.name}")
             continue
 
         # Track output filename
         output_filename = fluff_file.name
 
-        # Process each entity type
-        for entity_type, entities in entity_arrays:
-            # Group by source
-            grouped = group_entities_by_source(entities, entity_type, log)
+        # Same _meta object for every source; look it up once
+        meta = data.get("_meta")
 
+        # Accumulate all entity types per source, then write each
+        # source's file exactly once (same write-batching as
+        # process_json_file: the per-type saves both re-serialized and
+        # clobbered one another for multi-type fluff files).
+        pending: Dict[str, Dict[str, Any]] = {}
+
+        for entity_type, grouped in entity_groups.items():
             for source_id, source_entities in grouped.items():
                 if source_id not in sources:
                     log.warning(f"Unknown source '{source_id}' in {fluff_file.name}, skipping")
                     continue
 
-                # Create output directory
-                base_source = get_base_source(source_id)
-                submodule = get_submodule(source_id)
+                output_data = pending.get(source_id)
+                if output_data is None:
+                    # Build output data (preserve _meta and structure)
+                    output_data = {} if meta is None else {"_meta": meta}
+                    pending[source_id] = output_data
 
-                if submodule:
-                    # Submodule: data_rework/AitFR/DN/data/
-                    source_output_dir = output_dir / base_source / submodule / "data"
-                else:
-                    # Regular source: data_rework/PHB/data/
-                    source_output_dir = output_dir / base_source / "data"
+                # Add fluff entries for this source
+                output_data[entity_type] = source_entities
 
-                source_output_dir.mkdir(parents=True, exist_ok=True)
+        # Flush one file per source
+        for source_id, output_data in pending.items():
+            # Create output directory
+            base_source = get_base_source(source_id)
+            submodule = get_submodule(source_id)
 
-                # Build output data
-                output_data = {}
+            if submodule:
+                # Submodule: data_rework/AitFR/DN/data/
+                source_output_dir = output_dir / base_source / submodule / "data"
+            else:
+                # Regular source: data_rework/PHB/data/
+                source_output_dir = output_dir / base_source / "data"
 
-                # Copy _meta if present
-                if "_meta" in data:
-                    output_data["_meta"] = data["_meta"]
+            _ensure_dir(source_output_dir)
 
-                # Add fluff entries for this source
-                output_data[entity_type] = source_entities
+            entry_count = sum(
+                len(v) for k, v in output_data.items() if k != "_meta"
+            )
 
-                # Save to file
-                output_file = source_output_dir / output_filename
-                if save_json(output_data, output_file, log):
-                    if source_id not in counts_per_source:
-                        counts_per_source[source_id] = 0
-                    counts_per_source[source_id] += len(source_entities)
+            output_file = source_output_dir / output_filename
+            if save_json(output_data, output_file, log):
+                counts_per_source[source_id] += entry_count
 
     log.info(
         f"Processed fluff: {sum(counts_per_source.values())} entries "
@@ -740,6 +931,34 @@ def process_fluff_files(
 # Batch Processing
 # =============================================================================
 
+def _process_json_file_worker(
+    args: Tuple[str, Dict[str, Dict[str, Any]], str],
+) -> Tuple[str, Dict[str, int], List[str], List[str]]:
+    """
+    Process one JSON file in a worker process.
+
+    Module-level so the process pool can pickle it. Each input file
+    writes a distinct output filename per source, so workers never touch
+    the same output file. Errors and warnings are accumulated in a local
+    Statistics and shipped back for aggregation in the parent.
+
+    Args:
+        args: (json_path, sources, output_dir) with paths as strings
+
+    Returns:
+        (file_name, counts_per_source, errors, warnings)
+    """
+    json_path_str, sources, output_dir_str = args
+    json_path = Path(json_path_str)
+
+    local_stats = Statistics()
+    log = logging.getLogger("reorganize")
+
+    counts = process_json_file(json_path, sources, Path(output_dir_str), local_stats, log)
+
+    return json_path.name, counts, local_stats.errors, local_stats.warnings
+
+
 def process_all_json_files(
     data_dir: Path,
     sources: Dict[str, Dict[str, Any]],
@@ -762,22 +981,34 @@ def process_all_json_files(
     log = logger_instance or logger
     log.info("Processing JSON files...")
 
-    # Process main JSON files (in root of data/)
-    json_files = [
-        f for f in data_dir.glob("*.json")
-        if not should_skip_file(f.name, config.SKIP_FILES, config.SKIP_PATTERNS)
-    ]
+    # Partition data/*.json into main and fluff files in one scan
+    json_files, fluff_files = _scan_data_dir(data_dir)
 
     if json_files:
         log.info(f"Found {len(json_files)} main JSON files to process")
 
-        for json_file in create_progress_iterator(
-            json_files,
-            desc="Processing main JSON files",
-        ):
-            counts = process_json_file(json_file, sources, output_dir, stats, log)
-            if counts:
-                stats.add_json_stats(json_file.name, counts)
+        # Each file is independent, and parse/serialize is CPU-bound, so
+        # fan out across processes; stats come back per file and are
+        # aggregated here instead of being mutated from workers.
+        worker_args = [
+            (str(json_file), sources, str(output_dir))
+            for json_file in json_files
+        ]
+
+        with ProcessPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
+            results = executor.map(_process_json_file_worker, worker_args, chunksize=4)
+
+            for file_name, counts, errors, warnings in create_progress_iterator(
+                results,
+                desc="Processing main JSON files",
+                total=len(worker_args),
+            ):
+                for error in errors:
+                    stats.add_error(error)
+                for warning in warnings:
+                    stats.add_warning(warning)
+                if counts:
+                    stats.add_json_stats(file_name, counts)
 
     # Process special subdirectories
     if not skip_special_dirs:
@@ -796,7 +1027,9 @@ def process_all_json_files(
                 stats.add_json_stats("class", counts)
 
     # Fluff files (always process separately)
-    fluff_counts = process_fluff_files(data_dir, sources, output_dir, stats, log)
+    fluff_counts = process_fluff_files(
+        data_dir, sources, output_dir, stats, log, fluff_files=fluff_files
+    )
     if fluff_counts:
         stats.add_json_stats("fluff", fluff_counts)
 
@@ -15,7 +15,9 @@ Usage:
 
 import argparse
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to path for imports
@@ -173,7 +175,11 @@ def main():
 
     args = parser.parse_args()
 
-    # Create output directory early (needed for log file)
+    # Create output directory early (needed for log file). Check
+    # existence once, before the mkdir — re-statting afterwards would
+    # always be true and made the staleness warning below fire for the
+    # directory this run itself just created.
+    output_dir_existed = args.output_dir.exists()
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
     # Setup logging with file output
@@ -184,14 +190,14 @@ def main():
         log_file_path=log_file_path,
     )
 
-    # Check if output directory exists
-    if args.output_dir.exists():
+    if output_dir_existed:
         import shutil
 
         if args.clean:
             log.warning(f"⚠️  Deleting existing output directory: {args.output_dir}")
             try:
                 shutil.rmtree(args.output_dir)
+                args.output_dir.mkdir(parents=True, exist_ok=True)
                 log.info(f"✅ Deleted {args.output_dir}")
             except Exception as e:
                 log.error(f"❌ Failed to delete {args.output_dir}: {e}")
@@ -231,12 +237,15 @@ def main():
 
     # Filter sources if --sources specified
     if args.sources:
-        filtered_sources = {}
-        for source_id in args.sources:
-            if source_id in sources:
-                filtered_sources[source_id] = sources[source_id]
-            else:
-                log.warning(f"Unknown source: {source_id}")
+        requested = set(args.sources)
+        for source_id in sorted(requested - sources.keys()):
+            log.warning(f"Unknown source: {source_id}")
+
+        filtered_sources = {
+            source_id: book
+            for source_id, book in sources.items()
+            if source_id in requested
+        }
 
         if not filtered_sources:
             log.error("No valid sources specified")
@@ -245,10 +254,7 @@ def main():
         sources = filtered_sources
         log.info(f"Processing {len(sources)} specific sources: {', '.join(sources.keys())}")
 
-    # Create output directory
-    args.output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create directory structure
+    # Create directory structure (output dir itself was created above)
     create_source_directories(sources, args.output_dir, log)
 
     # Initialize statistics
@@ -266,72 +272,89 @@ def main():
             args.output_dir,
             stats,
             log,
-            skip_special_dirs=False,  # We'll handle them separately below
+            skip_special_dirs=True,  # Special dirs run concurrently below
         )
 
-        # Process special subdirectories separately
-        bestiary_dir = args.data_dir / "bestiary"
-        if bestiary_dir.exists():
-            bestiary_counts = process_bestiary_files(
-                bestiary_dir, sources, args.output_dir, stats, log
-            )
-            if bestiary_counts:
-                stats.add_json_stats("bestiary", bestiary_counts)
-
-        class_dir = args.data_dir / "class"
-        if class_dir.exists():
-            class_counts = process_class_files(
-                class_dir, sources, args.output_dir, stats, log
-            )
-            if class_counts:
-                stats.add_json_stats("class", class_counts)
-
-        book_dir = args.data_dir / "book"
-        if book_dir.exists():
-            book_counts = process_book_files(
-                book_dir, sources, args.output_dir, stats, log
+        # Process special subdirectories concurrently: each reads its own
+        # input directory and writes distinct per-source filenames, so
+        # they never touch the same files. Each task accumulates into a
+        # private Statistics merged in the parent.
+        special_steps = [
+            ("bestiary", process_bestiary_files, args.data_dir / "bestiary"),
+            ("class", process_class_files, args.data_dir / "class"),
+            ("book", process_book_files, args.data_dir / "book"),
+            ("spells", process_spells_files, args.data_dir / "spells"),
+        ]
+
+        # One directory read instead of a stat per special subdir
+        with os.scandir(args.data_dir) as entries:
+            existing_subdirs = {
+                entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+
+        def _run_special_step(name, process_fn, input_dir):
+            local_stats = Statistics()
+            counts = process_fn(
+                input_dir, sources, args.output_dir, local_stats, log
             )
-            if book_counts:
-                stats.add_json_stats("book", book_counts)
-
-        # Process spells directory
-        spells_dir = args.data_dir / "spells"
-        if spells_dir.exists():
-            spells_counts = process_spells_files(
-                spells_dir, sources, args.output_dir, stats, log
-            )
-            if spells_counts:
-                stats.add_json_stats("spells", spells_counts)
-
-        # Step 2: Copy images
+            return name, counts, local_stats
+
+        with ThreadPoolExecutor(max_workers=len(special_steps)) as executor:
+            futures = [
+                executor.submit(_run_special_step, name, process_fn, input_dir)
+                for name, process_fn, input_dir in special_steps
+                if input_dir.name in existing_subdirs
+            ]
+            for future in as_completed(futures):
+                name, counts, local_stats = future.result()
+                stats.merge(local_stats)
+                if counts:
+                    stats.add_json_stats(name, counts)
+
+        # Step 2: Copy images and PDFs. The two copiers read disjoint
+        # inputs and write to separate img/ and pdf/ trees, so they run
+        # concurrently; both are I/O-bound.
         log.info("=" * 60)
-        log.info("Step 2: Copying images...")
+        log.info("Step 2: Copying images and PDFs...")
         log.info("=" * 60)
 
         image_copier = get_copier("image")
-        image_copier.copy_all(sources, args.img_dir, args.output_dir, stats, log)
-
-        # Step 3: Copy PDFs
-        log.info("=" * 60)
-        log.info("Step 3: Copying PDFs...")
-        log.info("=" * 60)
-
         pdf_copier = get_copier("pdf")
-        pdf_copier.copy_all(sources, args.img_dir, args.output_dir, stats, log)
-
-        # Step 4: Quick integrity check
+        image_stats = Statistics()
+        pdf_stats = Statistics()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            copy_futures = [
+                executor.submit(
+                    image_copier.copy_all,
+                    sources, args.img_dir, args.output_dir, image_stats, log,
+                ),
+                executor.submit(
+                    pdf_copier.copy_all,
+                    sources, args.img_dir, args.output_dir, pdf_stats, log,
+                ),
+            ]
+            for future in copy_futures:
+                future.result()
+
+        stats.merge(image_stats)
+        stats.merge(pdf_stats)
+
+        # Step 3: Quick integrity check
         log.info("=" * 60)
-        log.info("Step 4: Quick integrity check...")
+        log.info("Step 3: Quick integrity check...")
         log.info("=" * 60)
 
         quick_integrity_check(args.data_dir, args.output_dir, stats, log)
 
-        # Step 5: Run validation (if not skipped)
+        # Step 4: Run validation (if not skipped)
         validation_report = None
 
         if not args.skip_validation:
             log.info("=" * 60)
-            log.info("Step 5: Running validation...")
+            log.info("Step 4: Running validation...")
             log.info("=" * 60)
 
             if args.quick_check_only:
@@ -376,13 +399,13 @@ def main():
         log.info("=" * 60)
         log.info(f"Sources processed: {len(sources)}")
         log.info(f"JSON files processed: {len(stats.json_files)}")
-        log.info(f"Images copied: {sum(sum(c.values()) if isinstance(c, dict) else [c] for c in stats.images.values())}")
-        log.info(f"PDFs copied: {sum(stats.pdfs.values())}")
+        log.info(f"Images copied: {stats.total_images}")
+        log.info(f"PDFs copied: {stats.total_pdfs}")
         log.info(f"Errors: {len(stats.errors)}")
         log.info(f"Warnings: {len(stats.warnings)}")
 
-        if stats.cross_source_references:
-            log.info(f"Cross-source references: {len(stats.cross_source_references)}")
+        if stats.total_cross_source_references:
+            log.info(f"Cross-source references: {stats.total_cross_source_references}")
 
         if validation_report:
             status = validation_report.get("overall_status", "unknown").upper()
@@ -7,9 +7,14 @@ This module contains helper functions used across the reorganization scripts.
 
 import json
 import logging
+import mmap
+import os
+import re
 import sys
-from datetime import datetime
-from fnmatch import fnmatch
+from collections import defaultdict
+from datetime import datetime, timezone
+from fnmatch import translate as fnmatch_translate
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -20,6 +25,11 @@ from scripts.reorganize import config
 # Logging Setup
 # =============================================================================
 
+# Arguments of the last setup_logging call; repeat calls with the same
+# configuration return the existing logger instead of rebuilding handlers
+_logging_signature: Optional[Tuple[bool, bool, Optional[str]]] = None
+
+
 def setup_logging(
     verbose: bool = False,
     quiet: bool = False,
@@ -36,6 +46,12 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    global _logging_signature
+
+    signature = (verbose, quiet, str(log_file_path) if log_file_path else None)
+    if signature == _logging_signature:
+        return logging.getLogger("reorganize")
+
     # Determine log level
     if quiet:
         log_level = logging.WARNING
@@ -76,6 +92,7 @@ def setup_logging(
         # Log file location at INFO level
         logger_instance.info(f"📝 Log file: {log_file_path}")
 
+    _logging_signature = signature
     return logger_instance
 
 
@@ -83,6 +100,28 @@ def setup_logging(
 # JSON Utilities
 # =============================================================================
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# orjson only supports 2-space indentation; leading space pairs are
+# rewritten to tabs to keep the output identical to the original files.
+_SPACE_INDENT_RE = re.compile(rb"^(?:  )+", re.MULTILINE)
+
+# Files above this size are memory-mapped instead of read into a bytes
+# object, so the parser works straight off the page cache (large
+# bestiary files run to several MB)
+_MMAP_THRESHOLD = 1_000_000
+
+
+def _space_indent_to_tabs(match: re.Match) -> bytes:
+    return b"\t" * (len(match.group(0)) // 2)
+
+
 def load_json(file_path: Path, logger: Optional[logging.Logger] = None) -> Optional[Dict[str, Any]]:
     """
     Load a JSON file.
@@ -98,6 +137,13 @@ def load_json(file_path: Path, logger: Optional[logging.Logger] = None) -> Optio
         logger.debug(f"Loading JSON file: {file_path}")
 
     try:
+        if ORJSON_AVAILABLE:
+            # orjson parses bytes directly, skipping the decode to str
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return orjson.loads(memoryview(mm))
+                return orjson.loads(f.read())
         with open(file_path, "r", encoding="utf-8") as f:
             data = json.load(f)
         return data
@@ -111,6 +157,10 @@ def load_json(file_path: Path, logger: Optional[logging.Logger] = None) -> Optio
         return None
 
 
+# Parent directories save_json has already created this run
+_saved_dirs: Set[str] = set()
+
+
 def save_json(
     data: Dict[str, Any],
     file_path: Path,
@@ -131,17 +181,48 @@ def save_json(
         logger.debug(f"Saving JSON file: {file_path}")
 
     try:
-        # Create parent directory if it doesn't exist
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(
+        # Create parent directory if it doesn't exist — once per
+        # directory per run; repeat writes into the same directory skip
+        # the stat+mkdir syscalls entirely
+        parent = str(file_path.parent)
+        if parent not in _saved_dirs:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            _saved_dirs.add(parent)
+
+        # orjson serializes several times faster than stdlib json; it never
+        # escapes non-ASCII, so only use it when that matches the config
+        if ORJSON_AVAILABLE and not config.JSON_ENSURE_ASCII:
+            option = orjson.OPT_INDENT_2
+            if config.JSON_SORT_KEYS:
+                option |= orjson.OPT_SORT_KEYS
+
+            serialized = orjson.dumps(data, option=option)
+            if config.JSON_INDENT == "\t":
+                serialized = _SPACE_INDENT_RE.sub(_space_indent_to_tabs, serialized)
+        else:
+            serialized = json.dumps(
                 data,
-                f,
                 indent=config.JSON_INDENT,
                 ensure_ascii=config.JSON_ENSURE_ASCII,
                 sort_keys=config.JSON_SORT_KEYS,
-            )
+            ).encode("utf-8")
+
+        # Re-runs on unchanged data produce identical bytes; skip the
+        # write (and the page-cache invalidation) when nothing changed
+        try:
+            if os.stat(file_path).st_size == len(serialized):
+                with open(file_path, "rb") as f:
+                    if f.read() == serialized:
+                        return True
+        except OSError:
+            pass
+
+        # Write to a temp file and rename so readers never see a
+        # partially written file
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(serialized)
+        os.replace(tmp_path, file_path)
 
         return True
     except Exception as e:
@@ -154,6 +235,14 @@ def save_json(
 # File System Utilities
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _compile_skip_patterns(skip_patterns: frozenset) -> Optional[re.Pattern]:
+    """Compile a set of fnmatch patterns into a single alternation regex."""
+    if not skip_patterns:
+        return None
+    return re.compile("|".join(fnmatch_translate(p) for p in sorted(skip_patterns)))
+
+
 def should_skip_file(filename: str, skip_files: Set[str], skip_patterns: Set[str]) -> bool:
     """
     Check if a file should be skipped.
@@ -170,10 +259,10 @@ def should_skip_file(filename: str, skip_files: Set[str], skip_patterns: Set[str
     if filename in skip_files:
         return True
 
-    # Check patterns
-    for pattern in skip_patterns:
-        if fnmatch(filename, pattern):
-            return True
+    # Check patterns (compiled once per pattern set, not once per file)
+    pattern = _compile_skip_patterns(frozenset(skip_patterns))
+    if pattern and pattern.match(filename):
+        return True
 
     return False
 
@@ -192,6 +281,41 @@ def should_skip_dir(dirname: str, skip_dirs: Set[str]) -> bool:
     return dirname in skip_dirs
 
 
+def iter_files(root: Path, skip_dirs: Optional[Set[str]] = None):
+    """
+    Recursively yield all files under a directory using os.scandir.
+
+    Avoids the per-path stat calls and object churn of Path.rglob, and
+    prunes skipped directories instead of descending into them.
+
+    Args:
+        root: Directory to walk
+        skip_dirs: Set of directory names to prune (default: config.SKIP_DIRS)
+
+    Yields:
+        Path objects for each regular file found
+    """
+    if skip_dirs is None:
+        skip_dirs = config.SKIP_DIRS
+
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    # Never descend through directory symlinks (matches
+                    # os.walk(followlinks=False)); guards against cycles.
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+        except (NotADirectoryError, FileNotFoundError):
+            continue
+
+
 def find_image_references(data: Any, source_id: str) -> List[Dict[str, Any]]:
     """
     Recursively find all image references in JSON data.
@@ -210,13 +334,18 @@ def find_image_references(data: Any, source_id: str) -> List[Dict[str, Any]]:
         }
     """
     references = []
-
-    def _search(obj: Any, depth: int = 0) -> None:
-        # Prevent infinite recursion
-        if depth > 100:
-            return
-
-        if isinstance(obj, dict):
+    append = references.append
+
+    # Explicit stack instead of recursion: JSON data is loaded as plain
+    # dicts and lists (acyclic), so no depth guard is needed, and the
+    # walker skips the per-node Python call frame the recursive version
+    # paid for every value in every file.
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+
+        if obj_type is dict:
             # Check if this is an image entry
             if obj.get("type") == "image" and "href" in obj:
                 href = obj["href"]
@@ -227,22 +356,18 @@ def find_image_references(data: Any, source_id: str) -> List[Dict[str, Any]]:
                         path_parts = path.split("/")
                         image_source = path_parts[0] if path_parts else None
 
-                        references.append({
+                        append({
                             "path": path,
                             "type": href.get("type", "internal"),
                             "is_cross_source": image_source and image_source != source_id,
                             "image_source": image_source,
                         })
 
-            # Recursively search all values
-            for value in obj.values():
-                _search(value, depth + 1)
+            stack.extend(obj.values())
 
-        elif isinstance(obj, list):
-            for item in obj:
-                _search(item, depth + 1)
+        elif obj_type is list:
+            stack.extend(obj)
 
-    _search(data)
     return references
 
 
@@ -250,6 +375,11 @@ def find_image_references(data: Any, source_id: str) -> List[Dict[str, Any]]:
 # Source Utilities
 # =============================================================================
 
+# Parsed books.json per absolute data dir, so repeated load_sources calls
+# within one process don't re-read and re-parse the file
+_sources_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+
 def load_sources(data_dir: Path, logger: Optional[logging.Logger] = None) -> Dict[str, Dict[str, Any]]:
     """
     Load all sources from books.json.
@@ -271,6 +401,13 @@ def load_sources(data_dir: Path, logger: Optional[logging.Logger] = None) -> Dic
             ...
         }
     """
+    # books.json is immutable for the lifetime of a run; repeated calls
+    # (main pipeline plus validation passes) reuse the first parse.
+    cache_key = os.path.abspath(data_dir)
+    cached = _sources_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     books_file = data_dir / "books.json"
 
     if not books_file.exists():
@@ -313,6 +450,7 @@ def load_sources(data_dir: Path, logger: Optional[logging.Logger] = None) -> Dic
             logger.debug(f"Source aliases (using source field): {', '.join(sorted(duplicate_aliases))}")
         logger.debug(f"Sources: {', '.join(sorted(sources.keys()))}")
 
+    _sources_cache[cache_key] = sources
     return sources
 
 
@@ -327,15 +465,16 @@ def get_source_group(source_id: str, logger: Optional[logging.Logger] = None) ->
     Returns:
         Group name (e.g., "core") or None if not found
     """
-    for group, sources in config.SOURCE_GROUPS.items():
-        if source_id in sources:
-            return group
+    group = config.SOURCE_TO_GROUP.get(source_id)
+    if group:
+        return group
 
     if logger:
         logger.warning(f"Source {source_id} not found in any group")
     return None
 
 
+@lru_cache(maxsize=None)
 def parse_source_id(source_id: str) -> Tuple[str, Optional[str]]:
     """
     Разбить source_id на базовый источник и submodule.
@@ -378,7 +517,6 @@ def parse_source_id(source_id: str) -> Tuple[str, Optional[str]]:
     # Особый случай для MCV (MCV + цифра + 2 буквы)
     # MCV1SC, MCV2DC, MCV3MC, MCV4EC (длина = 6)
     if source_id.startswith("MCV") and len(source_id) == 6 and source_id[3].isdigit():
-        import re
         match = re.match(r"(MCV)(\d{1}[A-Z]{2})", source_id)
         if match:
             return match.group(1), match.group(2)
@@ -431,6 +569,30 @@ def get_submodule(source_id: str) -> Optional[str]:
     return submodule
 
 
+@lru_cache(maxsize=None)
+def get_image_path_component(source_id: str) -> str:
+    """
+    Получить компонент пути в /img/ для source_id.
+
+    Единая точка для IMAGE_PATH_SPECIAL_MAPPINGS: особые случаи (PS-A -> PSA)
+    и submodule'ы (AitFR-DN -> AitFR/DN) разрешаются одним lookup'ом.
+
+    Args:
+        source_id: Source ID
+
+    Returns:
+        Компонент пути (например, "PHB", "PSA", "AitFR/DN")
+    """
+    mapped = config.IMAGE_PATH_SPECIAL_MAPPINGS.get(source_id)
+    if mapped is not None:
+        return mapped
+
+    base_source, submodule = parse_source_id(source_id)
+    if submodule:
+        return f"{base_source}/{submodule}"
+    return base_source
+
+
 def is_submodule(source_id: str) -> bool:
     """
     Проверить, является ли source_id submodule'ом.
@@ -489,7 +651,7 @@ def group_entities_by_source(
     Returns:
         Dict mapping source ID to list of entities
     """
-    grouped = {}
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
     missing_source = []
 
     for entity in entities:
@@ -499,8 +661,6 @@ def group_entities_by_source(
             missing_source.append(f"{entity_type}: {name}")
             continue
 
-        if source not in grouped:
-            grouped[source] = []
         grouped[source].append(entity)
 
     if logger and missing_source:
@@ -529,7 +689,8 @@ def deduplicate_entities(entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]
 	Returns:
 		Deduplicated list
 	"""
-	seen = {}
+	seen: Dict[Tuple[str, str], Dict[str, Any]] = {}
+	seen_get = seen.get
 	for entity in entities:
 		name = entity.get("name")
 		source = entity.get("source")
@@ -537,19 +698,15 @@ def deduplicate_entities(entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]
 			continue
 
 		key = (name, source)
-		page = entity.get("page")
+		existing = seen_get(key)
 
-		# Keep the version with a page number
-		if key not in seen:
+		if existing is None:
 			seen[key] = entity
 		else:
-			existing_page = seen[key].get("page")
-			# Prefer version with page number
-			if page is not None and (existing_page is None or page > 0):
+			# Keep the version with a page number
+			page = entity.get("page")
+			if page is not None and (existing.get("page") is None or page > 0):
 				seen[key] = entity
-			elif existing_page is None and page is None:
-				# Both null, keep the first one
-				pass
 
 	return list(seen.values())
 
@@ -594,6 +751,11 @@ def extract_entities_from_json(
 # Report Utilities
 # =============================================================================
 
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 def create_report(
     sources_processed: int,
     statistics: Dict[str, Any],
@@ -613,7 +775,7 @@ def create_report(
         Report dict
     """
     report = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
         "version": config.VERSION,
         "sources_processed": sources_processed,
         "statistics": statistics,
@@ -659,7 +821,14 @@ class Statistics:
         self.pdfs = {}
         self.errors = []
         self.warnings = []
+        # Bounded to the first examples reported; the full count lives
+        # in total_cross_source_references so memory stays flat however
+        # many references a run encounters
         self.cross_source_references = []
+        # Running totals, so the summary doesn't re-walk the nested dicts
+        self.total_images = 0
+        self.total_pdfs = 0
+        self.total_cross_source_references = 0
 
     def add_json_stats(self, filename: str, counts_per_source: Dict[str, int]) -> None:
         """Add JSON file statistics."""
@@ -667,12 +836,14 @@ class Statistics:
 
     def add_image_stats(self, source_id: str, category_counts: Dict[str, int]) -> None:
         """Add image statistics for a source."""
-        if source_id not in self.images:
-            self.images[source_id] = {}
-        self.images[source_id].update(category_counts)
+        existing = self.images.setdefault(source_id, {})
+        for category, count in category_counts.items():
+            self.total_images += count - existing.get(category, 0)
+            existing[category] = count
 
     def add_pdf_count(self, source_id: str, count: int) -> None:
         """Add PDF count for a source."""
+        self.total_pdfs += count - self.pdfs.get(source_id, 0)
         self.pdfs[source_id] = count
 
     def add_error(self, error: str) -> None:
@@ -683,9 +854,35 @@ class Statistics:
         """Add a warning."""
         self.warnings.append(warning)
 
+    # How many cross-source reference examples are retained
+    _MAX_CROSS_SOURCE_EXAMPLES = 100
+
     def add_cross_source_reference(self, ref: Dict[str, Any]) -> None:
         """Add a cross-source reference."""
-        self.cross_source_references.append(ref)
+        self.total_cross_source_references += 1
+        if len(self.cross_source_references) < self._MAX_CROSS_SOURCE_EXAMPLES:
+            self.cross_source_references.append(ref)
+
+    def merge(self, other: "Statistics") -> None:
+        """
+        Merge another Statistics instance into this one.
+
+        Lets parallel workers accumulate into private instances that are
+        folded together afterwards, instead of contending on shared state.
+        """
+        self.json_files.update(other.json_files)
+        for source_id, category_counts in other.images.items():
+            self.add_image_stats(source_id, category_counts)
+        for source_id, count in other.pdfs.items():
+            self.add_pdf_count(source_id, count)
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.total_cross_source_references += (
+            other.total_cross_source_references
+            - len(other.cross_source_references)
+        )
+        for ref in other.cross_source_references:
+            self.add_cross_source_reference(ref)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert statistics to dict."""
@@ -693,9 +890,11 @@ class Statistics:
             "json_files": self.json_files,
             "images": self.images,
             "pdfs": self.pdfs,
+            "total_images": self.total_images,
+            "total_pdfs": self.total_pdfs,
             "cross_source_references": {
-                "total": len(self.cross_source_references),
-                "examples": self.cross_source_references[:100],  # Limit examples
+                "total": self.total_cross_source_references,
+                "examples": self.cross_source_references,  # Capped at insert time
             },
             "total_errors": len(self.errors),
             "total_warnings": len(self.warnings),
@@ -706,12 +905,24 @@ class Statistics:
 # Progress Utilities
 # =============================================================================
 
-try:
-    from tqdm import tqdm
+# tqdm is imported lazily so runs with SHOW_PROGRESS disabled (and
+# importers that never touch progress helpers) skip its import cost.
+_TQDM = None
+_TQDM_CHECKED = False
 
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
+
+def _get_tqdm():
+    """Import and cache tqdm on first use (None if unavailable)."""
+    global _TQDM, _TQDM_CHECKED
+    if not _TQDM_CHECKED:
+        _TQDM_CHECKED = True
+        try:
+            from tqdm import tqdm
+
+            _TQDM = tqdm
+        except ImportError:
+            _TQDM = None
+    return _TQDM
 
 
 def create_progress_iterator(iterable, desc: str = "", **kwargs):
@@ -726,7 +937,47 @@ def create_progress_iterator(iterable, desc: str = "", **kwargs):
     Returns:
         Iterable with progress tracking
     """
-    if config.SHOW_PROGRESS and TQDM_AVAILABLE:
+    tqdm = _get_tqdm() if config.SHOW_PROGRESS else None
+    if tqdm:
         return tqdm(iterable, desc=desc, **kwargs)
     else:
         return iterable
+
+
+class _NullProgressBar:
+    """No-op stand-in for tqdm when progress display is disabled."""
+
+    def update(self, n: int = 1) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def create_progress_bar(total: Optional[int] = None, desc: str = "", **kwargs):
+    """
+    Create a manually-driven progress bar (tqdm if available, otherwise no-op).
+
+    Unlike create_progress_iterator, the caller advances the bar with
+    update() as work completes, which suits completion-order processing
+    (e.g. futures finishing out of submission order).
+
+    Args:
+        total: Total number of work items
+        desc: Description for progress bar
+        **kwargs: Additional arguments for tqdm
+
+    Returns:
+        Progress bar object supporting update()/close() and the
+        context-manager protocol
+    """
+    tqdm = _get_tqdm() if config.SHOW_PROGRESS else None
+    if tqdm:
+        return tqdm(total=total, desc=desc, **kwargs)
+    return _NullProgressBar()
@@ -7,11 +7,12 @@ This module runs validation scripts after reorganization is complete.
 
 import json
 import logging
+import os
 import subprocess
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from scripts.reorganize import config
 from scripts.reorganize.utils import (
@@ -22,13 +23,32 @@ from scripts.reorganize.utils import (
     create_report,
     save_json,
     setup_logging,
+    utc_timestamp,
 )
 
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # =============================================================================
 # Validation Script Runner
 # =============================================================================
 
+# Statuses that count a validation run as failed
+_FAILED_STATUSES = frozenset(("failed", "error", "timeout"))
+
+
 def run_validation_script(
     script_path: Path,
     args: List[str],
@@ -57,10 +77,12 @@ def run_validation_script(
     cmd = [sys.executable, str(script_path)] + args
 
     try:
+        # Capture raw bytes: json.loads accepts bytes directly, so a
+        # multi-MB JSON report skips the full UTF-8 str decode that
+        # text=True would force on capture
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=300,  # 5 minutes timeout
         )
 
@@ -72,20 +94,23 @@ def run_validation_script(
             except json.JSONDecodeError:
                 pass  # Not JSON output
 
+        # Only decode (and retain) the raw streams when debugging
+        debug = log.isEnabledFor(logging.DEBUG)
+
         validation_result = {
             "script": str(script_path),
             "name": script_path.name,
             "status": "passed" if result.returncode == 0 else "failed",
             "return_code": result.returncode,
-            "stdout": result.stdout if log.isEnabledFor(logging.DEBUG) else None,
-            "stderr": result.stderr if log.isEnabledFor(logging.DEBUG) else None,
+            "stdout": result.stdout.decode("utf-8", errors="replace") if debug else None,
+            "stderr": result.stderr.decode("utf-8", errors="replace") if debug else None,
             "output": output_data,
         }
 
         if result.returncode != 0:
             log.warning(f"  Validation failed: {script_path.name}")
             if result.stderr:
-                log.debug(f"  Error output: {result.stderr[:500]}")
+                log.debug(f"  Error output: {result.stderr[:500].decode('utf-8', errors='replace')}")
         else:
             log.info(f"  Validation passed: {script_path.name}")
 
@@ -139,7 +164,7 @@ def run_validation(
     log.info("=" * 60)
 
     validation_results = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
         "data_dir": str(data_dir),
         "data_rework_dir": str(data_rework_dir),
         "validations": [],
@@ -170,20 +195,14 @@ def run_validation(
             str(data_rework_dir),
         ]
 
-    result = run_validation_script(integrity_script, integrity_args, log)
-    validation_results["validations"].append(result)
-
-    # Run check_images
+    # check_images
     images_script = Path(config.VALIDATION_SCRIPTS["check_images"])
 
     images_args = common_args + [
         "--data-dir",  # Note: check_images might not have --data-dir, adjust as needed
     ]
 
-    result = run_validation_script(images_script, images_args, log)
-    validation_results["validations"].append(result)
-
-    # Run check_cross_source
+    # check_cross_source
     cross_source_script = Path(config.VALIDATION_SCRIPTS["check_cross_source"])
 
     cross_source_args = common_args + [
@@ -192,13 +211,28 @@ def run_validation(
         str(data_rework_dir),
     ]
 
-    result = run_validation_script(cross_source_script, cross_source_args, log)
-    validation_results["validations"].append(result)
+    # The scripts are independent subprocesses with no shared state, so
+    # run them concurrently: wall clock becomes the slowest script
+    # instead of the sum. Results keep this declaration order.
+    script_runs = [
+        (integrity_script, integrity_args),
+        (images_script, images_args),
+        (cross_source_script, cross_source_args),
+    ]
+
+    with ThreadPoolExecutor(max_workers=len(script_runs)) as executor:
+        futures = [
+            executor.submit(run_validation_script, script, script_args, log)
+            for script, script_args in script_runs
+        ]
+        validation_results["validations"].extend(
+            future.result() for future in futures
+        )
 
     # Calculate overall status
     failed_count = sum(
         1 for v in validation_results["validations"]
-        if v.get("status") in ["failed", "error", "timeout"]
+        if v["status"] in _FAILED_STATUSES
     )
 
     validation_results["overall_status"] = (
@@ -218,6 +252,100 @@ def run_validation(
     return validation_results
 
 
+# =============================================================================
+# Reorganized-Tree Helpers
+# =============================================================================
+
+def _find_source_json_files(data_rework_dir: Path) -> List[Path]:
+    """
+    List every data/*.json file in the reorganized tree.
+
+    The layout is fixed at source/[submodule/]data/*.json, so this walks
+    at most three levels with os.scandir instead of rglob("data/*.json"),
+    which descends every directory (including img/ trees) looking for the
+    data/ segment.
+
+    Args:
+        data_rework_dir: Path to /data_rework/ directory
+
+    Returns:
+        List of JSON file paths
+    """
+    json_files: List[Path] = []
+
+    def scan_data_dir(parent: str) -> None:
+        try:
+            with os.scandir(os.path.join(parent, "data")) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".json"):
+                        json_files.append(Path(entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+    try:
+        with os.scandir(data_rework_dir) as sources:
+            source_dirs = [s.path for s in sources if s.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
+        return json_files
+
+    for source_path in source_dirs:
+        scan_data_dir(source_path)
+
+        # Submodules nest one level deeper (e.g. AitFR/DN/data/)
+        with os.scandir(source_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False) and entry.name not in ("data", "img", "pdf"):
+                    scan_data_dir(entry.path)
+
+    return json_files
+
+
+def _scan_rework_tree(data_rework_dir: Path) -> Tuple[Set[str], int, int, int]:
+    """
+    Collect the quick-check counts over the output tree in one walk.
+
+    Classifies each directory by its path segments relative to the
+    output root: files under any img/ subtree count as images, *.pdf
+    directly inside a pdf/ directory count as PDFs, and *.json directly
+    inside a data/ directory count as JSON files (also marking the
+    top-level source as populated).
+
+    Args:
+        data_rework_dir: Path to /data_rework/ directory
+
+    Returns:
+        (sources_with_data, json_count, image_count, pdf_count)
+    """
+    sources_with_data: Set[str] = set()
+    json_count = 0
+    image_count = 0
+    pdf_count = 0
+
+    root = str(data_rework_dir)
+    prefix_len = len(root) + len(os.sep)
+
+    for dirpath, _dirnames, filenames in os.walk(root):
+        if not filenames:
+            continue
+
+        rel = dirpath[prefix_len:]
+        if not rel:
+            continue
+        parts = rel.split(os.sep)
+
+        if "img" in parts:
+            image_count += len(filenames)
+        elif parts[-1] == "pdf":
+            pdf_count += sum(1 for name in filenames if name.endswith(".pdf"))
+        elif parts[-1] == "data":
+            files_here = sum(1 for name in filenames if name.endswith(".json"))
+            if files_here:
+                json_count += files_here
+                sources_with_data.add(parts[0])
+
+    return sources_with_data, json_count, image_count, pdf_count
+
+
 # =============================================================================
 # Quick Integrity Check
 # =============================================================================
@@ -245,13 +373,13 @@ def quick_integrity_check(
 
     passed = True
 
-    # Check 1: Verify all sources were processed
-    sources_with_data = set()
-
-    for source_dir in data_rework_dir.iterdir():
-        if source_dir.is_dir() and (source_dir / "data").exists():
-            sources_with_data.add(source_dir.name)
+    # Checks 1-4 all need counts over the output tree; gather them in a
+    # single walk instead of an iterdir plus three rglob re-traversals
+    sources_with_data, json_count, image_count, pdf_count = _scan_rework_tree(
+        data_rework_dir
+    )
 
+    # Check 1: Verify all sources were processed
     log.info(f"  Sources processed: {len(sources_with_data)}")
 
     if stats.errors:
@@ -262,10 +390,6 @@ def quick_integrity_check(
         log.info(f"  Warnings during reorganization: {len(stats.warnings)}")
 
     # Check 2: Verify JSON files were created
-    json_count = sum(
-        1 for _ in data_rework_dir.rglob("data/*.json")
-    )
-
     log.info(f"  JSON files created: {json_count}")
 
     if json_count == 0:
@@ -273,24 +397,15 @@ def quick_integrity_check(
         passed = False
 
     # Check 3: Verify images were copied
-    image_count = sum(
-        1 for _ in data_rework_dir.rglob("img/**/*")
-        if _.is_file()
-    )
-
     log.info(f"  Images copied: {image_count}")
 
     # Check 4: Verify PDFs were copied
-    pdf_count = sum(
-        1 for _ in data_rework_dir.rglob("pdf/*.pdf")
-    )
-
     log.info(f"  PDFs copied: {pdf_count}")
 
     # Check 5: Cross-source references
-    if stats.cross_source_references:
+    if stats.total_cross_source_references:
         log.info(
-            f"  Cross-source references found: {len(stats.cross_source_references)}"
+            f"  Cross-source references found: {stats.total_cross_source_references}"
         )
 
         if config.COPY_CROSS_SOURCE_IMAGES:
@@ -312,6 +427,62 @@ def quick_integrity_check(
 # Baseline Creation
 # =============================================================================
 
+# Baseline files above this size are streamed rather than fully parsed
+_BASELINE_STREAM_THRESHOLD = 1_000_000
+
+
+def _count_entities_in_file(json_path_str: str) -> Tuple[str, Optional[Dict[str, int]], Optional[str]]:
+    """
+    Count items in the top-level arrays of one JSON file.
+
+    The baseline only needs array lengths, so large files are streamed
+    with ijson when available: each top-level array item is counted from
+    the event stream without materializing any Python objects. Small
+    files take the plain json.load path, which is faster below the
+    threshold.
+
+    Args:
+        json_path_str: Path to the JSON file as a string
+
+    Returns:
+        (filename, entity_counts, error_message) — entity_counts is None
+        when the file could not be read
+    """
+    name = os.path.basename(json_path_str)
+
+    try:
+        if IJSON_AVAILABLE and os.stat(json_path_str).st_size > _BASELINE_STREAM_THRESHOLD:
+            counts: Dict[str, int] = {}
+            item_events = ("start_map", "start_array", "string", "number", "boolean", "null")
+            with open(json_path_str, "rb") as f:
+                for prefix, event, _value in ijson.parse(f):
+                    # Top-level array items have prefix "<key>.item"
+                    if (
+                        event in item_events
+                        and prefix.endswith(".item")
+                        and "." not in prefix[:-5]
+                    ):
+                        key = prefix[:-5]
+                        counts[key] = counts.get(key, 0) + 1
+            return name, counts, None
+
+        if ORJSON_AVAILABLE:
+            with open(json_path_str, "rb") as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path_str, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        entity_counts = {}
+        for key, value in data.items():
+            if isinstance(value, list) and value:
+                entity_counts[key] = len(value)
+
+        return name, entity_counts, None
+
+    except Exception as e:
+        return name, None, str(e)
+
 def create_baseline(
     data_dir: Path,
     baseline_path: Path,
@@ -332,34 +503,30 @@ def create_baseline(
     log.info(f"Creating baseline: {baseline_path}")
 
     baseline_data = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
         "data_dir": str(data_dir),
         "files": {},
         "entity_counts": {},
     }
 
     # Count entities in each JSON file
-    json_files = list(data_dir.glob("*.json"))
-
-    for json_file in json_files:
-        # Skip certain files
-        if json_file.name in config.SKIP_FILES:
-            continue
-
-        try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Count entities
-            entity_counts = {}
-            for key, value in data.items():
-                if isinstance(value, list) and value:
-                    entity_counts[key] = len(value)
-
-            baseline_data["entity_counts"][json_file.name] = entity_counts
+    json_files = [
+        str(json_file)
+        for json_file in data_dir.glob("*.json")
+        if json_file.name not in config.SKIP_FILES
+    ]
 
-        except Exception as e:
-            log.warning(f"Failed to read {json_file.name}: {e}")
+    # JSON decoding is CPU-bound and the files are independent, so the
+    # counting fans out over a process pool; only the per-file count
+    # dicts come back to the parent
+    with ProcessPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
+        for name, entity_counts, error in executor.map(
+            _count_entities_in_file, json_files, chunksize=4
+        ):
+            if entity_counts is None:
+                log.warning(f"Failed to read {name}: {error}")
+            else:
+                baseline_data["entity_counts"][name] = entity_counts
 
     # Save baseline
     try:
@@ -380,6 +547,38 @@ def create_baseline(
 # Image Reference Checking
 # =============================================================================
 
+def _extract_image_references(
+    args: Tuple[str, str],
+) -> Optional[Tuple[str, str, List[Dict[str, Any]]]]:
+    """
+    Parse one JSON file and extract its image references.
+
+    Module-level so it can run in worker processes; JSON parsing is
+    CPU-bound and does not release the GIL, so files are parsed in a
+    process pool and only the extracted references come back.
+
+    Args:
+        args: (json_file, data_rework_dir) as strings
+
+    Returns:
+        (relative_path, source_id, references) or None if unusable
+    """
+    json_file_str, rework_root = args
+    json_file = Path(json_file_str)
+
+    data = load_json(json_file)
+    if not data:
+        return None
+
+    # Extract source ID from path (e.g., data_rework/PHB/data/...)
+    rel_path = json_file.relative_to(rework_root)
+    if len(rel_path.parts) < 2:
+        return None
+
+    source_id = rel_path.parts[0]
+    return str(rel_path), source_id, find_image_references(data, source_id)
+
+
 def check_image_references_in_reorganized_data(
     data_rework_dir: Path,
     img_dir: Path,
@@ -401,7 +600,7 @@ def check_image_references_in_reorganized_data(
     log.info("Checking image references in reorganized data...")
 
     # Find all JSON files in reorganized data
-    json_files = list(data_rework_dir.rglob("data/*.json"))
+    json_files = _find_source_json_files(data_rework_dir)
 
     if not json_files:
         log.warning("No JSON files found in reorganized data")
@@ -409,40 +608,37 @@ def check_image_references_in_reorganized_data(
 
     log.info(f"Found {len(json_files)} JSON files to check")
 
-    # Check each file
-    for json_file in create_progress_iterator(
-        json_files,
-        desc="Checking image references",
-    ):
-        data = load_json(json_file, log)
-        if not data:
-            continue
-
-        # Extract source ID from path (e.g., data_rework/PHB/data/...)
-        path_parts = json_file.relative_to(data_rework_dir).parts
-        if len(path_parts) < 2:
-            continue
-
-        source_id = path_parts[0]
-
-        # Find image references
-        references = find_image_references(data, source_id)
-
-        for ref in references:
-            image_path = img_dir / ref["path"]
-
-            # Check if image exists
-            if not image_path.exists():
-                error_msg = f"Image not found: {ref['path']} (referenced in {json_file.relative_to(data_rework_dir)})"
-                stats.add_error(error_msg)
-
-            # Track cross-source references
-            if ref["is_cross_source"]:
-                stats.add_cross_source_reference({
-                    "entity_source": source_id,
-                    "image_path": ref["path"],
-                    "image_source": ref.get("image_source"),
-                    "referenced_in": str(json_file.relative_to(data_rework_dir)),
-                })
+    # Parse and extract in worker processes; aggregate in this one
+    worker_args = [(str(json_file), str(data_rework_dir)) for json_file in json_files]
+
+    with ProcessPoolExecutor(max_workers=config.MAX_WORKERS) as executor:
+        results = executor.map(_extract_image_references, worker_args, chunksize=16)
+
+        for result in create_progress_iterator(
+            results,
+            desc="Checking image references",
+            total=len(worker_args),
+        ):
+            if result is None:
+                continue
+
+            rel_path, source_id, references = result
+
+            for ref in references:
+                image_path = img_dir / ref["path"]
+
+                # Check if image exists
+                if not image_path.exists():
+                    error_msg = f"Image not found: {ref['path']} (referenced in {rel_path})"
+                    stats.add_error(error_msg)
+
+                # Track cross-source references
+                if ref["is_cross_source"]:
+                    stats.add_cross_source_reference({
+                        "entity_source": source_id,
+                        "image_path": ref["path"],
+                        "image_source": ref.get("image_source"),
+                        "referenced_in": rel_path,
+                    })
 
     log.info("Image reference check complete")
@@ -15,8 +15,10 @@ Usage:
 import argparse
 import json
 import logging
+import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -27,9 +29,17 @@ sys.path.insert(0, str(project_root))
 from scripts.validation.image_path_utils import (
     ImageRef,
     ValidationResult,
+    build_image_index,
     validate_source_images,
 )
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # =============================================================================
 # Image Path Auditor
@@ -96,43 +106,68 @@ class ImagePathAuditor:
         self.log.info(f"Data directory: {self.data_dir}")
         self.log.info(f"Image directory: {self.img_dir}")
 
-        # Get list of sources to audit
+        # Get list of sources to audit. scandir serves the is_dir check
+        # from the directory read itself — no Path object or stat per
+        # entry — and sorting keeps the audit order deterministic.
         if sources:
-            source_dirs = [self.data_dir / s for s in sources]
+            data_dir_str = str(self.data_dir)
+            source_ids = [
+                s for s in sources
+                if os.path.isdir(os.path.join(data_dir_str, s))
+            ]
         else:
-            source_dirs = [d for d in self.data_dir.iterdir() if d.is_dir()]
-
-        self.log.info(f"Auditing {len(source_dirs)} sources...")
-
-        # Audit each source
-        all_validations = []
-
-        for source_dir in source_dirs:
-            source_id = source_dir.name
-
-            if not source_dir.is_dir():
-                continue
-
-            self.log.info(f"Auditing {source_id}...")
-
-            validations = validate_source_images(
-                source_id,
-                self.data_dir,
-                self.img_dir,
-                self.log,
-            )
-
-            all_validations.extend(validations)
-            self.stats["sources_scanned"] += 1
-
-        self.stats["total_image_references"] = len(all_validations)
-
-        # Categorize results
-        for validation in all_validations:
-            if validation.status in self.results:
-                self.results[validation.status].append(validation.to_dict())
-
-        self.stats["json_files_scanned"] = len(set(v.image_ref.file for v in all_validations))
+            with os.scandir(self.data_dir) as entries:
+                source_ids = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                )
+
+        self.log.info(f"Auditing {len(source_ids)} sources...")
+
+        # Walk img/ once up front; every existence check across all
+        # sources then probes this set instead of issuing a stat
+        img_index = build_image_index(self.img_dir)
+
+        # Audit sources concurrently: each validation walks its own
+        # source's JSON files and stats image paths, so the work is
+        # independent and I/O-bound. Futures are consumed in submission
+        # order to keep the report deterministic, and each source's
+        # results are categorized as they arrive instead of being
+        # gathered into one flat list first.
+        seen_files = set()
+        total_references = 0
+
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(source_ids) or 1)
+        ) as executor:
+            futures = []
+            for source_id in source_ids:
+                self.log.info(f"Auditing {source_id}...")
+                futures.append(
+                    executor.submit(
+                        validate_source_images,
+                        source_id,
+                        self.data_dir,
+                        self.img_dir,
+                        self.log,
+                        img_index,
+                    )
+                )
+
+            for future in futures:
+                validations = future.result()
+                total_references += len(validations)
+
+                for validation in validations:
+                    if validation.status in self.results:
+                        self.results[validation.status].append(validation.to_dict())
+                    seen_files.add(validation.image_ref.file)
+
+                self.stats["sources_scanned"] += 1
+
+        self.stats["total_image_references"] = total_references
+        self.stats["json_files_scanned"] = len(seen_files)
 
         # Generate report
         report = self._generate_report()
@@ -171,7 +206,7 @@ class ImagePathAuditor:
         }
 
         report = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             "scan_summary": self.stats,
             "issues": issues,
             "summary": summary,
@@ -208,8 +243,15 @@ class ImagePathAuditor:
         """Save report to JSON file."""
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        # orjson serializes in C and never escapes non-ASCII, matching
+        # the ensure_ascii=False output of the stdlib path
+        if ORJSON_AVAILABLE:
+            output_file.write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
 
         self.log.info(f"Report saved to: {output_file}")
 
@@ -344,6 +386,16 @@ def main():
 
 def _display_text_report(report: Dict[str, Any], severity: str, log: logging.Logger) -> None:
     """Display report in human-readable text format."""
+    # Unpack the report sections once instead of re-walking the nested
+    # dict in every branch below
+    scan_summary = report["scan_summary"]
+    summary = report["summary"]
+    issues = report["issues"]
+    missing = issues["missing_images"]
+    unexpected = issues["unexpected_locations"]
+    special = issues["special_cases"]
+    cross_source = issues["cross_source_references"]
+
     print()
     print("=" * 60)
     print("IMAGE PATH AUDIT REPORT")
@@ -351,49 +403,49 @@ def _display_text_report(report: Dict[str, Any], severity: str, log: logging.Log
     print(f"Timestamp: {report['timestamp']}")
     print()
     print("SCAN SUMMARY:")
-    print(f"  Sources scanned: {report['scan_summary']['sources_scanned']}")
-    print(f"  Total image references: {report['scan_summary']['total_image_references']}")
+    print(f"  Sources scanned: {scan_summary['sources_scanned']}")
+    print(f"  Total image references: {scan_summary['total_image_references']}")
     print()
     print("ISSUES:")
-    print(f"  Critical: {report['summary']['critical_issues']}")
-    print(f"  Warning: {report['summary']['warning_issues']}")
-    print(f"  Info: {report['summary']['info_issues']}")
-    print(f"  Special design decisions: {report['summary']['special_design_decisions']}")
+    print(f"  Critical: {summary['critical_issues']}")
+    print(f"  Warning: {summary['warning_issues']}")
+    print(f"  Info: {summary['info_issues']}")
+    print(f"  Special design decisions: {summary['special_design_decisions']}")
     print()
 
     # Display issues based on severity filter
     if severity in ["critical", "warning", "all"]:
-        if report["issues"]["missing_images"]:
+        if missing:
             print("MISSING IMAGES:")
-            for issue in report["issues"]["missing_images"]:
+            for issue in missing:
                 print(f"  ❌ {issue['source']}/{issue['file']}: {issue['path']}")
                 print(f"     {issue['message']}")
             print()
 
     if severity in ["warning", "all"]:
-        if report["issues"]["unexpected_locations"]:
+        if unexpected:
             print("UNEXPECTED LOCATIONS:")
-            for issue in report["issues"]["unexpected_locations"]:
+            for issue in unexpected:
                 print(f"  ⚠️  {issue['source']}/{issue['file']}: {issue['path']}")
                 print(f"     {issue['message']}")
             print()
 
     if severity in ["all"]:
-        if report["issues"]["special_cases"]:
+        if special:
             print("SPECIAL CASES (Design Decisions):")
-            for issue in report["issues"]["special_cases"][:5]:  # Show first 5
+            for issue in special[:5]:  # Show first 5
                 print(f"  ℹ️  {issue['source']}: {issue['message']}")
-            if len(report["issues"]["special_cases"]) > 5:
-                print(f"  ... and {len(report['issues']['special_cases']) - 5} more")
+            if len(special) > 5:
+                print(f"  ... and {len(special) - 5} more")
             print()
 
-        if report["issues"]["cross_source_references"]:
+        if cross_source:
             print("CROSS-SOURCE REFERENCES:")
-            for issue in report["issues"]["cross_source_references"][:5]:  # Show first 5
+            for issue in cross_source[:5]:  # Show first 5
                 print(f"  🔗 {issue['source']}/{issue['file']}: {issue['path']}")
                 print(f"     {issue['message']}")
-            if len(report["issues"]["cross_source_references"]) > 5:
-                print(f"  ... and {len(report['issues']['cross_source_references']) - 5} more")
+            if len(cross_source) > 5:
+                print(f"  ... and {len(cross_source) - 5} more")
             print()
 
     print("RECOMMENDATIONS:")
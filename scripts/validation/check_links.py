@@ -19,12 +19,67 @@ Examples:
 
 import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
 from collections import defaultdict
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _load_json_file(json_path_str: str) -> Tuple[str, Any, Optional[str]]:
+    """Загружает один JSON файл (worker для пула процессов).
+
+    Возвращает (путь, данные, ошибка); данные None при ошибке.
+    """
+    try:
+        with open(json_path_str, "rb") as f:
+            raw = f.read()
+        # orjson парсит байты в C без текстового декодирования
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw)
+        return json_path_str, data, None
+    except (ValueError, UnicodeDecodeError, OSError) as e:
+        return json_path_str, None, str(e)
+
+
+class BrokenLink(NamedTuple):
+    """Запись о битой ссылке.
+
+    NamedTuple вместо dict: примерно вдвое компактнее и без
+    hash-таблицы на каждую запись.
+    """
+    tag: str
+    tag_type: str
+    target_name: str
+    target_source: Optional[str]
+    in_entity: str
+    in_file: str
+    reason: str
+
+
+class CrossSourceLink(NamedTuple):
+    """Запись о cross-source ссылке."""
+    tag: str
+    tag_type: str
+    target_name: str
+    target_requested_source: str
+    target_actual_source: str
+    in_entity: str
+    in_file: str
+
 
 class LinkChecker:
     """Проверяет ссылки в JSON данных 5etools."""
@@ -38,16 +93,27 @@ class LinkChecker:
         "sense", "trap", "hazard", "creatureTemplate"
     }
 
-    # Regex pattern to find tags in text
-    TAG_PATTERN = re.compile(r'\{@(\w+)\s+([^}]*)\}')
+    # Regex pattern to find tags in text; имя и source выделяются
+    # группами прямо в regex-движке, без split('|') на каждый тег
+    # (группы: тип, имя, source, остальные pipe-части)
+    TAG_PATTERN = re.compile(r'\{@(\w+)\s+([^|}]*)(?:\|([^|}]*))?(\|[^}]*)?\}')
 
     def __init__(self, data_dir: Path):
         """Инициализация checker'а с путём к директории данных."""
         self.data_dir = Path(data_dir)
         self.entities: Dict[str, Dict[str, List[Dict]]] = defaultdict(lambda: defaultdict(list))
-        self.broken_links: List[Dict[str, Any]] = []
-        self.cross_source_links: List[Dict[str, Any]] = []
+        # Индекс (категория, имя в нижнем регистре) -> entities,
+        # чтобы разрешение тега было одним hash-lookup, а не
+        # линейным перебором всех sources категории
+        self._index: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        self.broken_links: List[BrokenLink] = []
+        self.cross_source_links: List[CrossSourceLink] = []
         self.total_links_checked = 0
+        # Теги, извлечённые при загрузке; разрешаются в check_links,
+        # когда индекс построен полностью
+        self._pending_links: List[Tuple[str, str, Optional[str], str, str, str]] = []
+        # Кэш разрешения категории по типу тега (None = не разрешилась)
+        self._category_cache: Dict[str, Optional[str]] = {}
 
     def _is_source_based_structure(self) -> bool:
         """Определяет, является ли структура source-based (data_rework) или content-based (data)."""
@@ -83,22 +149,36 @@ class LinkChecker:
         if is_source_based:
             # Source-based структура: data_rework/PHB/data/*.json
             print("Обнаружена source-based структура (data_rework/)", file=sys.stderr)
-            for source_dir in self.data_dir.iterdir():
-                if not source_dir.is_dir():
-                    continue
-
-                data_subdir = source_dir / "data"
-                if not data_subdir.exists():
+            with os.scandir(self.data_dir) as entries:
+                source_paths = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+
+            for source_path in source_paths:
+                # Один scandir по data/ вместо пяти glob-проходов:
+                # собираем JSON верхнего уровня и известные поддиректории
+                subdirs = []
+                try:
+                    with os.scandir(os.path.join(source_path, "data")) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name in ("bestiary", "class", "adventure", "book"):
+                                    subdirs.append(entry.path)
+                            elif entry.name.endswith(".json"):
+                                json_files.append(Path(entry.path))
+                except FileNotFoundError:
                     continue
 
-                # Основные JSON файлы
-                json_files.extend(data_subdir.glob("*.json"))
-
-                # Поддиректории (bestiary/, class/, adventure/, book/)
-                json_files.extend(data_subdir.glob("bestiary/*.json"))
-                json_files.extend(data_subdir.glob("class/*.json"))
-                json_files.extend(data_subdir.glob("adventure/*.json"))
-                json_files.extend(data_subdir.glob("book/*.json"))
+                for subdir in subdirs:
+                    with os.scandir(subdir) as entries:
+                        json_files.extend(
+                            Path(entry.path)
+                            for entry in entries
+                            if entry.name.endswith(".json")
+                            and entry.is_file(follow_symlinks=False)
+                        )
         else:
             # Content-based структура: data/*.json, data/*/*.json
             print("Обнаружена content-based структура (data/)", file=sys.stderr)
@@ -110,10 +190,22 @@ class LinkChecker:
 
         print(f"Найдено {len(json_files)} JSON файлов для обработки", file=sys.stderr)
 
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        # Разбор файлов — CPU-bound и независим по файлам, поэтому
+        # парсим в пуле процессов; индексация идёт в родителе в порядке
+        # списка файлов, так что результат детерминирован
+        with ProcessPoolExecutor() as executor:
+            parsed = executor.map(
+                _load_json_file,
+                [str(f) for f in json_files],
+                chunksize=16,
+            )
+
+            for path_str, data, error in parsed:
+                if error is not None:
+                    print(f"Ошибка чтения {path_str}: {error}", file=sys.stderr)
+                    continue
+
+                json_file = Path(path_str)
 
                 # Обрабатываем различные структуры данных
                 if isinstance(data, dict):
@@ -123,9 +215,6 @@ class LinkChecker:
                 elif isinstance(data, list):
                     self._process_entities(data, json_file.stem, json_file)
 
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                print(f"Ошибка чтения {json_file}: {e}", file=sys.stderr)
-
         # Вывод статистики загрузки
         total_entities = sum(len(sources) for sources in self.entities.values())
         print(f"Загружено {total_entities} entities из {len(self.entities)} категорий", file=sys.stderr)
@@ -138,7 +227,14 @@ class LinkChecker:
                 print(f"  {cat}: {count} entities", file=sys.stderr)
 
     def _process_entities(self, entities: List[Dict], category: str, source_file: Path) -> None:
-        """Обрабатывает список entities и индексирует их."""
+        """Обрабатывает список entities и индексирует их.
+
+        Теги извлекаются сразу при загрузке, поэтому сам dict entity
+        дальше не хранится: индекс держит только имя, source и файл,
+        а не весь разобранный JSON корпуса.
+        """
+        file_str = str(source_file.relative_to(self.data_dir.parent))
+
         for entity in entities:
             if not isinstance(entity, dict):
                 continue
@@ -149,102 +245,150 @@ class LinkChecker:
 
             if name and source:
                 # Индексируем по категории и source (храним как список для дубликатов)
-                self.entities[category][source].append({
+                # source_lower считается один раз при загрузке, а не
+                # при каждом сравнении в _find_entity
+                record = {
                     "name": name,
                     "source": source,
-                    "data": entity,
-                    "file": str(source_file.relative_to(self.data_dir.parent))
-                })
+                    "source_lower": source.lower(),
+                    "file": file_str
+                }
+                self.entities[category][source].append(record)
+                self._index[(category, name.lower())].append(record)
+
+                self._check_entity_links(entity, f"{name} ({source})", file_str)
 
     def check_links(self) -> None:
-        """Проверяет все ссылки в данных."""
+        """Разрешает собранные при загрузке ссылки по полному индексу."""
         print("Проверка ссылок...", file=sys.stderr)
 
-        for category, sources in self.entities.items():
-            for source, entities in sources.items():
-                for entity in entities:
-                    self._check_entity_links(entity["data"], entity, entity["file"])
-
-    def _check_entity_links(self, data: Any, entity_info: Dict, file_path: str) -> None:
-        """Рекурсивно проверяет ссылки в entity."""
-        if isinstance(data, str):
-            self._check_string_links(data, entity_info, file_path)
-        elif isinstance(data, dict):
-            for value in data.values():
-                self._check_entity_links(value, entity_info, file_path)
-        elif isinstance(data, list):
-            for item in data:
-                self._check_entity_links(item, entity_info, file_path)
-
-    def _check_string_links(self, text: str, entity_info: Dict, file_path: str) -> None:
-        """Проверяет ссылки в строке."""
-        matches = self.TAG_PATTERN.finditer(text)
-
-        for match in matches:
-            tag_type = match.group(1)
-            tag_content = match.group(2)
-            full_tag = match.group(0)
-
-            self.total_links_checked += 1
-
-            # Проверяем только entity теги
-            if tag_type not in self.ENTITY_TAGS:
-                return
+        find_entity = self._find_entity
 
-            # Парсим содержимое тега
-            parts = tag_content.split("|")
-            name = parts[0].strip().lower()
-            source = parts[1].strip().lower() if len(parts) > 1 else None
-            entity_name = entity_info["name"]
-            entity_source = entity_info["source"]
+        # Один и тот же тег (например {@spell fireball|phb}) встречается
+        # в сотнях statblock'ов — результат разрешения кэшируется по
+        # (тип, имя, source). Sentinel отличает закэшированный None
+        # (битая ссылка) от промаха кэша.
+        cache: Dict[Tuple[str, str, Optional[str]], Optional[Dict[str, Any]]] = {}
+        miss = object()
 
-            # Ищем entity
-            found = self._find_entity(tag_type, name, source)
+        for tag_type, name, source, full_tag, entity_label, file_path in self._pending_links:
+            key = (tag_type, name, source)
+            found = cache.get(key, miss)
+            if found is miss:
+                found = cache[key] = find_entity(tag_type, name, source)
 
             if not found:
                 # Битая ссылка
-                self.broken_links.append({
-                    "tag": full_tag,
-                    "tag_type": tag_type,
-                    "target_name": name,
-                    "target_source": source,
-                    "in_entity": f"{entity_name} ({entity_source})",
-                    "in_file": file_path,
-                    "reason": "Entity not found"
-                })
-            elif source and found["source"].lower() != source:
+                self.broken_links.append(BrokenLink(
+                    full_tag,
+                    tag_type,
+                    name,
+                    source,
+                    entity_label,
+                    file_path,
+                    "Entity not found",
+                ))
+            elif source and found["source_lower"] != source:
                 # Cross-source ссылка
-                self.cross_source_links.append({
-                    "tag": full_tag,
-                    "tag_type": tag_type,
-                    "target_name": name,
-                    "target_requested_source": source,
-                    "target_actual_source": found["source"],
-                    "in_entity": f"{entity_name} ({entity_source})",
-                    "in_file": file_path
-                })
+                self.cross_source_links.append(CrossSourceLink(
+                    full_tag,
+                    tag_type,
+                    name,
+                    source,
+                    found["source"],
+                    entity_label,
+                    file_path,
+                ))
+
+    def _check_entity_links(self, data: Any, entity_label: str, file_path: str) -> None:
+        """Итеративно проверяет ссылки в entity.
+
+        Явный стек вместо рекурсии: обход не тратит кадр вызова на
+        каждый вложенный dict/list, а проверка типа через type() —
+        это одно сравнение указателей вместо isinstance.
+        """
+        check_string = self._check_string_links
+        stack = [data]
+
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+
+            if node_type is str:
+                # Подстрочная проверка в C на порядки дешевле запуска
+                # regex-движка, а большинство строк тегов не содержит
+                if "{@" in node:
+                    check_string(node, entity_label, file_path)
+            elif node_type is dict:
+                stack.extend(node.values())
+            elif node_type is list:
+                stack.extend(node)
+
+    def _check_string_links(self, text: str, entity_label: str, file_path: str) -> None:
+        """Извлекает ссылки из строки в отложенный список.
+
+        Разрешение откладывается до check_links: на момент загрузки
+        индекс ещё неполон, а тег может указывать на entity из файла,
+        который будет загружен позже.
+        """
+        # Атрибутные lookups выносятся из цикла по тегам в локальные
+        # имена; счётчик копится локально и пишется в self один раз
+        entity_tags = self.ENTITY_TAGS
+        append_pending = self._pending_links.append
+        checked = 0
+
+        # findall отдаёт кортежи групп из C без Match-объектов;
+        # не-entity теги отбрасываются до разбора содержимого
+        for tag_type, name_raw, source_raw, rest in self.TAG_PATTERN.findall(text):
+            checked += 1
 
-    def _find_entity(self, tag_type: str, name: str, source: str = None) -> Dict[str, Any] | None:
-        """Ищет entity по типу, имени и source."""
-        # Определяем категорию по тегу
-        category_map = {
-            "spell": "spell",
-            "item": "item",
-            "creature": "monster",  # creature -> monster
-            "feat": "feat",
-            "race": "race",
-            "background": "background",
-            "deity": "deity",
-            "class": "class",
-            "subclass": "subclass",
-            "condition": "condition",
-            "disease": "disease",
-            "language": "language",
-            "card": "card",
-        }
+            # Проверяем только entity теги
+            if tag_type not in entity_tags:
+                continue
 
-        # Получаем категорию
-        category = category_map.get(tag_type)
+            if source_raw or rest:
+                full_tag = f"{{@{tag_type} {name_raw}|{source_raw}{rest}}}"
+            else:
+                full_tag = f"{{@{tag_type} {name_raw}}}"
+
+            name = name_raw.strip().lower()
+            source = source_raw.strip().lower() if source_raw else None
+
+            append_pending(
+                (tag_type, name, source, full_tag, entity_label, file_path)
+            )
+
+        self.total_links_checked += checked
+
+    # Маппинг тег -> категория данных; константа класса, а не литерал
+    # внутри _find_entity, который пересобирался при каждом вызове
+    CATEGORY_MAP = {
+        "spell": "spell",
+        "item": "item",
+        "creature": "monster",  # creature -> monster
+        "feat": "feat",
+        "race": "race",
+        "background": "background",
+        "deity": "deity",
+        "class": "class",
+        "subclass": "subclass",
+        "condition": "condition",
+        "disease": "disease",
+        "language": "language",
+        "card": "card",
+    }
+
+    def _resolve_category(self, tag_type: str) -> Optional[str]:
+        """Определяет категорию данных для типа тега.
+
+        Результат (включая неудачу) запоминается по типу тега, так что
+        fuzzy-перебор категорий выполняется не чаще одного раза на тип,
+        а не на каждый проверяемый тег.
+        """
+        if tag_type in self._category_cache:
+            return self._category_cache[tag_type]
+
+        category = self.CATEGORY_MAP.get(tag_type)
 
         # Если нет прямого маппинга, пробуем найти
         if not category:
@@ -253,46 +397,64 @@ class LinkChecker:
                 category = tag_type
             else:
                 # Пробуем найти по частичному совпадению
+                tag_type_lower = tag_type.lower()
                 for cat in self.entities.keys():
-                    if tag_type.lower() in cat.lower() or cat.lower() in tag_type.lower():
+                    cat_lower = cat.lower()
+                    if tag_type_lower in cat_lower or cat_lower in tag_type_lower:
                         category = cat
                         break
 
+        self._category_cache[tag_type] = category
+        return category
+
+    def _find_entity(self, tag_type: str, name: str, source: str = None) -> Dict[str, Any] | None:
+        """Ищет entity по типу, имени и source."""
+        # Получаем категорию
+        category = self._resolve_category(tag_type)
+
         if not category or category not in self.entities:
             return None
 
-        # Ищем в указанном source или во всех
+        # Один lookup в индексе вместо перебора всех sources категории
+        candidates = self._index.get((category, name))
+        if not candidates:
+            return None
+
+        # Ищем в указанном source или берём первый найденный
         if source:
-            # Пытаемся найти с точным совпадением source (case-insensitive)
-            for src, entities in self.entities[category].items():
-                if src.lower() == source:
-                    for entity in entities:
-                        if entity["name"].lower() == name:
-                            return entity
-        else:
-            # Ищем во всех sources для этой категории
-            for source_entities in self.entities[category].values():
-                for entity in source_entities:
-                    if entity["name"].lower() == name:
-                        return entity
+            for entity in candidates:
+                if entity["source_lower"] == source:
+                    return entity
+            return None
 
-        return None
+        return candidates[0]
 
     def generate_report(self) -> Dict[str, Any]:
         """Генерирует отчёт о проверке."""
-        # Группируем битые ссылки по типу
-        broken_by_type = defaultdict(list)
-        for link in self.broken_links:
-            broken_by_type[link["tag_type"]].append(link)
+        # Группируем ссылки по типу: сортировка + groupby с C-шным
+        # itemgetter вместо dict-append на каждую ссылку; стабильная
+        # сортировка сохраняет порядок обнаружения внутри типа.
+        # Сортируем копии — all_broken_links ниже отдаёт первые 100
+        # в порядке обнаружения
+        by_tag_type = attrgetter("tag_type")
+
+        broken_by_type = {
+            tag_type: list(group)
+            for tag_type, group in groupby(
+                sorted(self.broken_links, key=by_tag_type), key=by_tag_type
+            )
+        }
 
-        # Группируем cross-source ссылки по типу
-        cross_source_by_type = defaultdict(list)
-        for link in self.cross_source_links:
-            cross_source_by_type[link["tag_type"]].append(link)
+        cross_source_by_type = {
+            tag_type: list(group)
+            for tag_type, group in groupby(
+                sorted(self.cross_source_links, key=by_tag_type), key=by_tag_type
+            )
+        }
 
         # Считаем уникальные entities с проблемами
-        entities_with_broken = set(link["in_entity"] for link in self.broken_links)
-        entities_with_cross_source = set(link["in_entity"] for link in self.cross_source_links)
+        entities_with_broken = set(link.in_entity for link in self.broken_links)
+        entities_with_cross_source = set(link.in_entity for link in self.cross_source_links)
 
         return {
             "summary": {
@@ -305,22 +467,51 @@ class LinkChecker:
             "broken_links_by_type": {
                 tag_type: {
                     "count": len(links),
-                    "sample": links[:5]  # Первые 5 примеров
+                    # Первые 5 примеров; в dict конвертируем только их
+                    "sample": [link._asdict() for link in links[:5]]
                 }
                 for tag_type, links in broken_by_type.items()
             },
             "cross_source_links_by_type": {
                 tag_type: {
                     "count": len(links),
-                    "sample": links[:5]  # Первые 5 примеров
+                    "sample": [link._asdict() for link in links[:5]]  # Первые 5 примеров
                 }
                 for tag_type, links in cross_source_by_type.items()
             },
-            "all_broken_links": self.broken_links[:100],  # Первые 100
-            "all_cross_source_links": self.cross_source_links[:100],  # Первые 100
+            # Первые 100
+            "all_broken_links": [link._asdict() for link in self.broken_links[:100]],
+            "all_cross_source_links": [link._asdict() for link in self.cross_source_links[:100]],
         }
 
 
+def run_check(argv=None) -> Dict[str, Any]:
+    """
+    Построить отчёт без печати и кода выхода — для запуска in-process
+    из run-all.py.
+
+    Args:
+        argv: Аргументы командной строки; распознаётся только --data-dir,
+            остальные флаги оркестратора игнорируются
+
+    Returns:
+        Отчёт о проверке
+    """
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--data-dir", type=Path, default=Path("data"))
+    args, _ = parser.parse_known_args(argv)
+
+    checker = LinkChecker(args.data_dir)
+    checker.load_all_data()
+    checker.check_links()
+
+    report = checker.generate_report()
+    # Статус нужен оркестратору: при запуске подпроцессом провал
+    # выражался кодом выхода, in-process его выражает это поле
+    report["status"] = "ERROR" if report["summary"]["broken_links_count"] > 0 else "OK"
+    return report
+
+
 def main():
     """Главная функция."""
     parser = argparse.ArgumentParser(
@@ -360,15 +551,28 @@ def main():
 
     # Выводим результаты
     if args.output == "json":
-        output = json.dumps(report, indent=2, ensure_ascii=False)
+        # orjson сериализует в C и отдаёт байты сразу — без
+        # промежуточной Python-строки и повторного encode
+        if ORJSON_AVAILABLE:
+            output_bytes = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        else:
+            output_bytes = json.dumps(
+                report, indent=2, ensure_ascii=False
+            ).encode("utf-8")
+
+        if args.output_file:
+            args.output_file.write_bytes(output_bytes)
+            print(f"\nОтчёт сохранён в: {args.output_file}", file=sys.stderr)
+        else:
+            sys.stdout.buffer.write(output_bytes + b"\n")
     else:
         output = format_text_report(report)
 
-    if args.output_file:
-        args.output_file.write_text(output, encoding="utf-8")
-        print(f"\nОтчёт сохранён в: {args.output_file}", file=sys.stderr)
-    else:
-        print(output)
+        if args.output_file:
+            args.output_file.write_text(output, encoding="utf-8")
+            print(f"\nОтчёт сохранён в: {args.output_file}", file=sys.stderr)
+        else:
+            print(output)
 
     # Возвращаем код выхода
     return 1 if report["summary"]["broken_links_count"] > 0 else 0
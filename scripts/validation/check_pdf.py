@@ -12,12 +12,48 @@ Usage:
     cd /path/to/5etools-src && python scripts/validation/check_pdf.py
 """
 
+import argparse
 import json
+import mmap
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, Set
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _walk_files(root: Path, suffix: str) -> Iterator[str]:
+    """Итеративный обход дерева через os.scandir.
+
+    DirEntry кэширует тип элемента из самого чтения директории, так
+    что обход не делает stat на каждый файл, в отличие от rglob,
+    который к тому же строит Path для всех промежуточных элементов.
+
+    Yields:
+        Абсолютные пути файлов с заданным суффиксом
+    """
+    stack = [str(root)]
+
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
+
+
+# Байтовый паттерн: regex идёт прямо по отображённым страницам файла,
+# без декодирования и без копии содержимого в Python-строку
+_PDF_REF_PATTERN = re.compile(rb'pdf/([^\s"}]+\.pdf)')
 
 
 class PDFValidator:
@@ -68,9 +104,11 @@ class PDFValidator:
             print(f"❌ Директория {self.pdf_dir} не существует", file=sys.stderr)
             return pdf_files
 
-        for pdf_path in self.pdf_dir.rglob("*.pdf"):
-            rel_path = pdf_path.relative_to(self.pdf_dir)
-            pdf_files[str(rel_path)] = pdf_path
+        prefix_len = len(str(self.pdf_dir)) + len(os.sep)
+
+        for pdf_path_str in _walk_files(self.pdf_dir, ".pdf"):
+            rel_path = pdf_path_str[prefix_len:].replace(os.sep, "/")
+            pdf_files[rel_path] = Path(pdf_path_str)
 
         return pdf_files
 
@@ -98,17 +136,22 @@ class PDFValidator:
                 print(f"  ❌ Не является файлом: {rel_path}")
                 continue
 
-            # Проверка чтения файла
+            # Проверка чтения файла: голый дескриптор вместо файлового
+            # объекта — нужны только 4 байта заголовка, BufferedReader
+            # с его fstat и буфером здесь лишний
             try:
-                with open(abs_path, "rb") as f:
-                    # Читаем заголовок PDF
-                    header = f.read(4)
-                    if header != b"%PDF":
-                        self.results["pdf_files"]["broken"].append(str(rel_path))
-                        self.results["summary"]["errors"] += 1
-                        print(f"  ⚠️  Повреждённый PDF: {rel_path}")
-                    else:
-                        self.results["pdf_files"]["accessible"] += 1
+                fd = os.open(str(abs_path), os.O_RDONLY)
+                try:
+                    header = os.read(fd, 4)
+                finally:
+                    os.close(fd)
+
+                if header != b"%PDF":
+                    self.results["pdf_files"]["broken"].append(str(rel_path))
+                    self.results["summary"]["errors"] += 1
+                    print(f"  ⚠️  Повреждённый PDF: {rel_path}")
+                else:
+                    self.results["pdf_files"]["accessible"] += 1
             except Exception as e:
                 self.results["pdf_files"]["inaccessible"].append(str(rel_path))
                 self.results["summary"]["errors"] += 1
@@ -123,27 +166,27 @@ class PDFValidator:
         """
         print("\n🔍 Поиск ссылок на PDF в JSON данных...")
 
-        pdf_pattern = re.compile(r'pdf/([^\s"}]+\.pdf)')
         referenced_pdfs = set()
 
-        # Обходим все JSON файлы в data/
-        for json_file in self.data_dir.rglob("*.json"):
+        # Обходим все JSON файлы в data/; mmap отдаёт regex-движку
+        # байты из page cache без чтения всего файла в строку
+        for json_file in _walk_files(self.data_dir, ".json"):
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                # Ищем все ссылки на PDF
-                matches = pdf_pattern.findall(content)
-                for match in matches:
-                    # Убираем лишние кавычки и пробелы
-                    pdf_path = match.strip('"').strip("'")
-                    referenced_pdfs.add(pdf_path)
-                    self.results["json_references"]["total"] += 1
-
-            except json.JSONDecodeError:
-                # Пропускаем файлы с ошибками JSON
-                continue
-            except Exception as e:
+                with open(json_file, "rb") as f:
+                    try:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except ValueError:
+                        # Пустой файл — отображать нечего
+                        continue
+
+                    with mm:
+                        for match in _PDF_REF_PATTERN.finditer(mm):
+                            # Убираем лишние кавычки и пробелы
+                            pdf_path = match.group(1).decode("utf-8").strip('"').strip("'")
+                            referenced_pdfs.add(pdf_path)
+                            self.results["json_references"]["total"] += 1
+
+            except OSError as e:
                 print(f"  ⚠️  Ошибка чтения {json_file}: {e}", file=sys.stderr)
                 continue
 
@@ -223,59 +266,65 @@ class PDFValidator:
         """
         Вывести отчёт в stdout.
 
+        Отчёт собирается в список строк и пишется одним вызовом,
+        а не отдельным print на каждую строку.
+
         Args:
             report: Отчёт о проверке
         """
-        print("\n" + "="*60)
-        print("📊 ОТЧЁТ О ПРОВЕРКЕ PDF")
-        print("="*60)
+        lines = []
+        lines.append("\n" + "="*60)
+        lines.append("📊 ОТЧЁТ О ПРОВЕРКЕ PDF")
+        lines.append("="*60)
 
         # Статус
         status_emoji = "✅" if report["status"] == "success" else "❌"
-        print(f"\n{status_emoji} Статус: {report['status'].upper()}")
+        lines.append(f"\n{status_emoji} Статус: {report['status'].upper()}")
 
         # PDF файлы
-        print(f"\n📁 PDF файлы:")
-        print(f"  Всего: {report['pdf_files']['total']}")
-        print(f"  Доступно: {report['pdf_files']['accessible']}")
-        print(f"  Недоступно: {len(report['pdf_files']['inaccessible'])}")
-        print(f"  Повреждено: {len(report['pdf_files']['broken'])}")
+        lines.append(f"\n📁 PDF файлы:")
+        lines.append(f"  Всего: {report['pdf_files']['total']}")
+        lines.append(f"  Доступно: {report['pdf_files']['accessible']}")
+        lines.append(f"  Недоступно: {len(report['pdf_files']['inaccessible'])}")
+        lines.append(f"  Повреждено: {len(report['pdf_files']['broken'])}")
 
         if report['pdf_files']['inaccessible']:
-            print(f"\n  ❌ Недоступные файлы:")
+            lines.append(f"\n  ❌ Недоступные файлы:")
             for f in report['pdf_files']['inaccessible']:
-                print(f"    - {f}")
+                lines.append(f"    - {f}")
 
         if report['pdf_files']['broken']:
-            print(f"\n  ⚠️  Повреждённые файлы:")
+            lines.append(f"\n  ⚠️  Повреждённые файлы:")
             for f in report['pdf_files']['broken']:
-                print(f"    - {f}")
+                lines.append(f"    - {f}")
 
         # Ссылки в JSON
-        print(f"\n🔗 Ссылки в JSON данных:")
-        print(f"  Всего ссылок: {report['json_references']['total_references']}")
-        print(f"  Валидных: {report['json_references']['valid_files']}")
-        print(f"  Отсутствует файлов: {len(report['json_references']['missing_files'])}")
+        lines.append(f"\n🔗 Ссылки в JSON данных:")
+        lines.append(f"  Всего ссылок: {report['json_references']['total_references']}")
+        lines.append(f"  Валидных: {report['json_references']['valid_files']}")
+        lines.append(f"  Отсутствует файлов: {len(report['json_references']['missing_files'])}")
 
         if report['json_references']['missing_files']:
-            print(f"\n  ❌ Отсутствующие файлы:")
+            lines.append(f"\n  ❌ Отсутствующие файлы:")
             for f in report['json_references']['missing_files']:
-                print(f"    - {f}")
+                lines.append(f"    - {f}")
 
         # Неиспользуемые PDF
-        print(f"\n📋 Неиспользуемые PDF файлы: {len(report['unreferenced_pdfs'])}")
+        lines.append(f"\n📋 Неиспользуемые PDF файлы: {len(report['unreferenced_pdfs'])}")
         if report['unreferenced_pdfs']:
-            print(f"  ⚠️  Неиспользуемые файлы:")
+            lines.append(f"  ⚠️  Неиспользуемые файлы:")
             for f in report['unreferenced_pdfs'][:10]:  # Показываем первые 10
-                print(f"    - {f}")
+                lines.append(f"    - {f}")
             if len(report['unreferenced_pdfs']) > 10:
-                print(f"    ... и ещё {len(report['unreferenced_pdfs']) - 10}")
+                lines.append(f"    ... и ещё {len(report['unreferenced_pdfs']) - 10}")
 
         # Итог
-        print(f"\n📈 Итог:")
-        print(f"  Ошибок: {report['summary']['errors']}")
-        print(f"  Предупреждений: {report['summary']['warnings']}")
-        print("="*60 + "\n")
+        lines.append(f"\n📈 Итог:")
+        lines.append(f"  Ошибок: {report['summary']['errors']}")
+        lines.append(f"  Предупреждений: {report['summary']['warnings']}")
+        lines.append("="*60 + "\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def run(self) -> Dict:
         """
@@ -300,16 +349,39 @@ class PDFValidator:
         self.validate_pdf_references(pdf_files, referenced_pdfs)
 
         # Генерируем отчёт
-        report = self.generate_report()
+        return self.generate_report()
 
-        # Выводим отчёт
-        self.print_report(report)
 
-        return report
+def run_check(argv=None) -> Dict:
+    """
+    Построить отчёт без печати и кода выхода — для запуска in-process
+    из run-all.py.
+
+    Args:
+        argv: Аргументы командной строки (сейчас не используются)
+
+    Returns:
+        Отчёт о проверке
+    """
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent.parent
+    return PDFValidator(project_root).run()
 
 
 def main():
     """Главная функция."""
+    parser = argparse.ArgumentParser(
+        description="Проверка PDF файлов и ссылок на них"
+    )
+    parser.add_argument(
+        "--output",
+        choices=["text", "json"],
+        default="text",
+        help="Формат вывода (default: text)"
+    )
+
+    args = parser.parse_args()
+
     # Определяем корневую директорию проекта
     script_dir = Path(__file__).parent
     project_root = script_dir.parent.parent
@@ -318,8 +390,17 @@ def main():
     validator = PDFValidator(project_root)
     report = validator.run()
 
-    # Выводим JSON отчёт для машинной обработки
-    print(json.dumps(report, indent=2, ensure_ascii=False))
+    # Выводим отчёт в одном формате — раньше текстовый отчёт и JSON
+    # печатались оба, и весь отчёт сериализовался дважды
+    if args.output == "json":
+        if ORJSON_AVAILABLE:
+            sys.stdout.buffer.write(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n"
+            )
+        else:
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        validator.print_report(report)
 
     # Выход с кодом ошибки
     sys.exit(0 if report["status"] == "success" else 1)
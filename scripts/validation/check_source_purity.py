@@ -13,51 +13,90 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+try:
+	import orjson
 
-def check_entities_recursive(entities: List[Dict], expected_source: str, json_file: Path, path: str = "") -> List[Dict[str, Any]]:
+	ORJSON_AVAILABLE = True
+except ImportError:
+	ORJSON_AVAILABLE = False
+
+# Рабочая директория не меняется за время проверки — вычисляем префикс
+# один раз; отрезание префикса вместо Path.relative_to не строит
+# PurePath и не падает на путях вне рабочей директории
+_CWD_PREFIX = str(Path.cwd()) + os.sep
+
+# Сколько ошибок держать в памяти для текстового отчёта; полный список
+# нужен только JSON-выводу, остальное уходит потоково в --errors-file
+_MAX_DISPLAY_ERRORS = 100
+
+# Ключи, вложенные массивы которых не проверяются на source
+_SKIP_KEYS = frozenset(("entries", "additionalEntites", "additionalEntities"))
+
+
+def check_entities_recursive(entities: List[Dict], expected_source: str, file_str: str, path: str = "") -> List[Dict[str, Any]]:
 	"""
-	Рекурсивно проверить все сущности на правильный source.
+	Проверить все сущности на правильный source.
+
+	Обход итеративный, через явный стек: вложенные массивы не тратят
+	кадр вызова на каждый уровень, а имя оставлено прежним для
+	совместимости вызовов.
 
 	Args:
 		entities: Список сущностей
 		expected_source: Ожидаемый source
-		json_file: Путь к JSON файлу
+		file_str: Путь к JSON файлу относительно рабочей директории
 		path: Текущий путь в JSON структуре
 
 	Returns:
 		Список ошибок
 	"""
 	errors = []
-
-	if not isinstance(entities, list):
-		return errors
-
-	for entity in entities:
-		if not isinstance(entity, dict):
+	append_error = errors.append
+	stack = [(entities, path)]
+	# JSON-данные содержат только обычные dict/list, поэтому точная
+	# проверка типа вместо isinstance (без обхода MRO); типы и ключи
+	# пропуска связаны локально — без глобальных lookup в горячем цикле
+	_list = list
+	_dict = dict
+	skip_keys = _SKIP_KEYS
+
+	while stack:
+		current_entities, current_path = stack.pop()
+
+		if type(current_entities) is not _list:
 			continue
 
-		source = entity.get("source")
-		name = entity.get("name", "Unknown")
-
-		# Проверить source
-		if source is not None and source != expected_source:
-			errors.append({
-				"file": str(json_file.relative_to(Path.cwd())),
-				"path": path,
-				"entity_name": name,
-				"expected_source": expected_source,
-				"actual_source": source
-			})
-
-		# Рекурсивно проверить вложенные массивы
-		for key, value in entity.items():
-			if isinstance(value, list) and key not in ["entries", "additionalEntites", "additionalEntities"]:
-				new_path = f"{path}.{key}" if path else key
-				errors.extend(check_entities_recursive(value, expected_source, json_file, new_path))
+		for entity in current_entities:
+			if type(entity) is not _dict:
+				continue
+
+			source = entity.get("source")
+
+			# Проверить source
+			if source is not None and source != expected_source:
+				append_error({
+					"file": file_str,
+					"path": current_path,
+					"entity_name": entity.get("name", "Unknown"),
+					"expected_source": expected_source,
+					"actual_source": source
+				})
+
+			# Вложенные массивы кладутся в стек. Большинство сущностей —
+			# листовые, со скалярными полями; any() по values() отсекает
+			# их C-циклом до Python-цикла по items()
+			if any(type(v) is _list for v in entity.values()):
+				for key, value in entity.items():
+					if type(value) is _list and key not in skip_keys:
+						stack.append((value, f"{current_path}.{key}" if current_path else key))
 
 	return errors
 
@@ -73,12 +112,19 @@ def check_file_source_purity(json_file: Path, expected_source: str) -> List[Dict
 	Returns:
 		Список ошибок (пустой, если всё ОК)
 	"""
+	f_str = str(json_file)
+	file_str = f_str[len(_CWD_PREFIX):] if f_str.startswith(_CWD_PREFIX) else f_str
+
 	try:
-		with open(json_file, 'r', encoding='utf-8') as f:
-			data = json.load(f)
+		# orjson парсит байты в C без текстового декодирования
+		raw = json_file.read_bytes()
+		if ORJSON_AVAILABLE:
+			data = orjson.loads(raw)
+		else:
+			data = json.loads(raw)
 	except Exception as e:
 		return [{
-			"file": str(json_file.relative_to(Path.cwd())),
+			"file": file_str,
 			"error": f"Failed to load JSON: {e}"
 		}]
 
@@ -90,17 +136,25 @@ def check_file_source_purity(json_file: Path, expected_source: str) -> List[Dict
 			continue
 
 		if isinstance(value, list):
-			errors.extend(check_entities_recursive(value, expected_source, json_file, key))
+			errors.extend(check_entities_recursive(value, expected_source, file_str, key))
 
 	return errors
 
 
-def check_source_purity(data_rework_dir: Path) -> Dict[str, Any]:
+def check_source_purity(
+	data_rework_dir: Path,
+	errors_path: Optional[Path] = None,
+	max_stored_errors: Optional[int] = None,
+) -> Dict[str, Any]:
 	"""
 	Проверить чистоту всех источников в data_rework/.
 
 	Args:
 		data_rework_dir: Путь к data_rework/ директории
+		errors_path: Если задан — писать каждую ошибку потоково в этот
+			NDJSON файл вместо накопления всего списка в памяти
+		max_stored_errors: Если задан — хранить в отчёте не больше
+			стольких ошибок; счётчик в summary при этом считает все
 
 	Returns:
 		Отчёт в формате JSON
@@ -113,41 +167,114 @@ def check_source_purity(data_rework_dir: Path) -> Dict[str, Any]:
 		}
 
 	all_errors = []
-	checked_files = 0
-
-	# Проверить каждый источник
-	for source_dir in sorted(data_rework_dir.iterdir()):
-		if not source_dir.is_dir():
-			continue
-
-		source_id = source_dir.name
-		data_dir = source_dir / "data"
-
-		if not data_dir.exists():
+	total_errors = 0
+
+	# Собрать все (файл, источник) пары. Один scandir на уровень:
+	# тип элемента берётся из чтения директории без stat, а отдельная
+	# проверка существования data/ не нужна — несуществующая
+	# директория даёт FileNotFoundError
+	tasks = []
+
+	with os.scandir(data_rework_dir) as entries:
+		source_ids = sorted(
+			entry.name
+			for entry in entries
+			if entry.is_dir(follow_symlinks=False)
+		)
+
+	for source_id in source_ids:
+		data_dir = data_rework_dir / source_id / "data"
+
+		try:
+			with os.scandir(data_dir) as entries:
+				json_names = sorted(
+					entry.name
+					for entry in entries
+					if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+				)
+		except FileNotFoundError:
 			continue
 
-		# Проверить все JSON файлы
-		for json_file in sorted(data_dir.glob("*.json")):
-			errors = check_file_source_purity(json_file, source_id)
+		for name in json_names:
+			tasks.append((data_dir / name, source_id))
 
-			if errors:
-				all_errors.extend(errors)
+	# Файлы независимы, а разбор и обход — CPU-bound, поэтому
+	# проверка идёт в пуле процессов; executor.map сохраняет порядок
+	# задач, так что список ошибок детерминирован. Ошибки каждой
+	# партии сразу уходят в NDJSON файл (если задан), в памяти
+	# остаётся счётчик и ограниченная выборка для отчёта
+	errors_out = None
+	if errors_path is not None:
+		errors_path.parent.mkdir(parents=True, exist_ok=True)
+		errors_out = open(errors_path, "wb")
 
-			checked_files += 1
+	try:
+		if tasks:
+			with ProcessPoolExecutor() as executor:
+				for errors in executor.map(
+					check_file_source_purity,
+					[json_file for json_file, _ in tasks],
+					[source_id for _, source_id in tasks],
+					chunksize=8,
+				):
+					if not errors:
+						continue
+
+					total_errors += len(errors)
+
+					if errors_out is not None:
+						for error in errors:
+							if ORJSON_AVAILABLE:
+								errors_out.write(orjson.dumps(error))
+							else:
+								errors_out.write(json.dumps(error, ensure_ascii=False).encode("utf-8"))
+							errors_out.write(b"\n")
+
+					if max_stored_errors is None:
+						all_errors.extend(errors)
+					elif len(all_errors) < max_stored_errors:
+						all_errors.extend(errors[:max_stored_errors - len(all_errors)])
+	finally:
+		if errors_out is not None:
+			errors_out.close()
+
+	checked_files = len(tasks)
 
 	report = {
 		"script": "check_source_purity.py",
-		"status": "OK" if not all_errors else "ERROR",
+		"status": "OK" if total_errors == 0 else "ERROR",
 		"summary": {
 			"checked_files": checked_files,
-			"total_errors": len(all_errors)
+			"total_errors": total_errors
 		},
 		"errors": all_errors
 	}
 
+	if errors_path is not None:
+		report["errors_file"] = str(errors_path)
+
 	return report
 
 
+def run_check(argv=None) -> Dict[str, Any]:
+	"""
+	Построить отчёт без печати и кода выхода — для запуска in-process
+	из run-all.py.
+
+	Args:
+		argv: Аргументы командной строки; распознаётся только --data-dir,
+			остальные флаги оркестратора игнорируются
+
+	Returns:
+		Отчёт о проверке
+	"""
+	parser = argparse.ArgumentParser(add_help=False)
+	parser.add_argument("--data-dir", type=Path, default=Path("data_rework"))
+	args, _ = parser.parse_known_args(argv)
+
+	return check_source_purity(args.data_dir)
+
+
 def main():
 	parser = argparse.ArgumentParser(
 		description="Проверить чистоту источников в data_rework/"
@@ -169,18 +296,32 @@ def main():
 		type=Path,
 		help="Сохранить отчёт в файл"
 	)
+	parser.add_argument(
+		"--errors-file",
+		type=Path,
+		help="Писать все ошибки потоково в NDJSON файл"
+	)
 
 	args = parser.parse_args()
 
-	# Запустить проверку
+	# Запустить проверку. Полный список ошибок в памяти нужен только
+	# JSON-выводу; текстовый отчёт показывает ограниченную выборку
 	print(f"Проверка: {args.data_dir}")
 	print("=" * 60)
 
-	report = check_source_purity(args.data_dir)
+	report = check_source_purity(
+		args.data_dir,
+		errors_path=args.errors_file,
+		max_stored_errors=None if args.output == "json" else _MAX_DISPLAY_ERRORS,
+	)
 
-	# Вывод
+	# Вывод. orjson сериализует отчёт в C и отдаёт байты сразу —
+	# без промежуточной Python-строки и повторного encode
 	if args.output == "json":
-		print(json.dumps(report, indent=2, ensure_ascii=False))
+		if ORJSON_AVAILABLE:
+			sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n")
+		else:
+			print(json.dumps(report, indent=2, ensure_ascii=False))
 	else:
 		# Текстовый формат
 		if report["status"] == "ERROR":
@@ -191,15 +332,12 @@ def main():
 				print()
 
 				# Группировать ошибки по файлам
-				errors_by_file = {}
+				errors_by_file = defaultdict(list)
 				for error in report["errors"]:
-					file = error["file"]
-					if file not in errors_by_file:
-						errors_by_file[file] = []
-					errors_by_file[file].append(error)
+					errors_by_file[error["file"]].append(error)
 
 				# Показать первые 10 файлов с ошибками
-				for i, (file, errors) in enumerate(list(errors_by_file.items())[:10]):
+				for file, errors in islice(errors_by_file.items(), 10):
 					print(f"  📄 {file}: {len(errors)} ошибок")
 					for error in errors[:3]:  # Показать первые 3 ошибки в файле
 						if "error" in error:
@@ -213,6 +351,11 @@ def main():
 				if total_files > 10:
 					print(f"\n  ... и ещё {total_files - 10} файлов с ошибками")
 
+				total_errors = report["summary"]["total_errors"]
+				if total_errors > len(report["errors"]):
+					hint = f" (полный список: {report['errors_file']})" if "errors_file" in report else ""
+					print(f"\n  Показаны первые {len(report['errors'])} из {total_errors} ошибок{hint}")
+
 				print(f"\nПроверено файлов: {report['summary']['checked_files']}")
 		else:
 			print(f"✅ Проверка прошла успешно!")
@@ -221,8 +364,11 @@ def main():
 	# Сохранить в файл
 	if args.output_file:
 		args.output_file.parent.mkdir(parents=True, exist_ok=True)
-		with open(args.output_file, 'w', encoding='utf-8') as f:
-			json.dump(report, f, indent=2, ensure_ascii=False)
+		if ORJSON_AVAILABLE:
+			args.output_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+		else:
+			with open(args.output_file, 'w', encoding='utf-8') as f:
+				json.dump(report, f, indent=2, ensure_ascii=False)
 		print(f"\nОтчёт сохранён: {args.output_file}")
 
 	# Exit code
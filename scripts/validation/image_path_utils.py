@@ -6,10 +6,14 @@ This module provides shared utilities for auditing and fixing image references
 in JSON files across the data_rework directory structure.
 """
 
+import functools
+import json
 import logging
-from dataclasses import dataclass, field
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent
@@ -18,6 +22,13 @@ sys.path.insert(0, str(project_root))
 
 from scripts.reorganize import config
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # =============================================================================
 # Data Classes
@@ -80,16 +91,64 @@ class ValidationResult:
         }
 
 
+# =============================================================================
+# Image Directory Index
+# =============================================================================
+
+def build_image_index(img_dir: Path) -> Set[str]:
+    """
+    Index the img/ tree once for O(1) existence checks.
+
+    Walks the directory a single time and records the relative path of
+    every file and directory, so validating thousands of references
+    costs set probes instead of a stat syscall each.
+
+    Args:
+        img_dir: Base img directory
+
+    Returns:
+        Set of slash-separated paths relative to img_dir
+    """
+    index: Set[str] = set()
+    root = str(img_dir)
+    prefix_len = len(root) + len(os.sep)
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = dirpath[prefix_len:].replace(os.sep, "/")
+        if rel:
+            index.add(rel)
+            rel += "/"
+        for name in filenames:
+            index.add(rel + name)
+
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_img_dir(img_dir: Path) -> "frozenset[str]":
+    """
+    Build and cache the image index for callers that did not supply one.
+
+    The walk runs once per distinct img_dir for the lifetime of the
+    process, so even index-less callers pay a single listing instead of
+    a stat syscall per candidate path.
+    """
+    return frozenset(build_image_index(img_dir))
+
+
 # =============================================================================
 # Path Normalization Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
 def normalize_source_for_image_path(source_id: str) -> str:
     """
     Normalize source ID for use in image paths.
 
     This handles special cases where the source folder name differs from
-    the image path component (design decisions, not bugs).
+    the image path component (design decisions, not bugs). The result is
+    memoized: the mapping lookup runs once per distinct source ID rather
+    than once per image reference.
 
     Examples:
         PS-A -> PSA
@@ -111,109 +170,70 @@ def normalize_source_for_image_path(source_id: str) -> str:
     return source_id
 
 
-def get_expected_image_path(
+def resolve_image_paths(
     source_id: str,
     image_path: str,
     img_dir: Path,
-) -> Optional[Path]:
+    img_index: Optional[Set[str]] = None,
+    _normalized: Optional[str] = None,
+) -> "tuple[Optional[Path], Optional[Path]]":
     """
-    Get the expected filesystem path for an image reference.
+    Resolve the expected and actual filesystem paths for an image reference.
+
+    One pass replaces the former get_expected_image_path and
+    get_actual_image_path pair: the image path is split once, the source
+    is normalized once, and when the path as written already matches the
+    expected location only a single existence check is made.
 
     Args:
         source_id: Source ID (e.g., "PS-A")
         image_path: Path from JSON (e.g., "book/PSA/001.webp")
         img_dir: Base img directory
+        img_index: Optional prebuilt index from build_image_index; when
+            given, existence checks are set probes instead of stats
+        _normalized: Precomputed normalize_source_for_image_path(source_id),
+            when the caller already has it
 
     Returns:
-        Path object if image should exist in this source's directory,
-        None if it's a cross-source reference
+        Tuple of (expected_path, actual_path). expected_path is None for
+        cross-source references; actual_path is None when the image does
+        not exist on disk.
     """
-    # Extract category and path components
+    # Extract category and path components. Candidates are built with
+    # plain string arithmetic — Path construction re-parses its
+    # arguments on every division, so it is deferred to the returns
     parts = image_path.split("/", 1)
     if len(parts) != 2:
-        return None
+        return None, None
 
     category, rest = parts
+    path_source, _, subpath = rest.partition("/")
 
-    # Extract source component from the path
-    path_parts = rest.split("/")
-    if not path_parts:
-        return None
-
-    path_source = path_parts[0]
-
-    # Check if it's a cross-source reference
-    normalized_source = normalize_source_for_image_path(source_id)
-    if path_source != normalized_source:
-        # Cross-source reference - image is in a different source's directory
-        return None
-
-    # Build expected path for this source
-    # The 'rest' already includes the source component, so we don't add it again
-    expected_path = img_dir / category / rest
-
-    return expected_path
-
-
-def get_actual_image_path(
-    source_id: str,
-    image_path: str,
-    img_dir: Path,
-) -> Optional[Path]:
-    """
-    Get the actual filesystem path where an image is located.
-
-    This handles special cases and checks if the image exists in various locations.
+    normalized = _normalized if _normalized is not None else normalize_source_for_image_path(source_id)
 
-    Args:
-        source_id: Source ID (e.g., "PS-A")
-        image_path: Path from JSON (e.g., "book/PSA/001.webp")
-        img_dir: Base img directory
+    if img_index is None:
+        img_index = _scan_img_dir(img_dir)
 
-    Returns:
-        Path object if image exists, None otherwise
-    """
-    # Extract category and rest of path
-    parts = image_path.split("/", 1)
-    if len(parts) != 2:
-        return None
-
-    category, rest = parts
-    path_parts = rest.split("/")
-    if not path_parts:
-        return None
-
-    path_source = path_parts[0]
-    filename = path_parts[-1] if len(path_parts) > 1 else None
-    subpath = "/".join(path_parts[1:]) if len(path_parts) > 1 else None
+    # Expected path exists only when the reference stays within this
+    # source; the 'rest' already includes the source component
+    expected_rel = f"{category}/{rest}" if path_source == normalized else None
+    expected_path = img_dir / expected_rel if expected_rel else None
 
     # Try the path as specified in JSON first
-    direct_path = img_dir / category / path_source
-    if subpath:
-        direct_path = direct_path / subpath
-
-    if direct_path.exists():
-        return direct_path
-
-    # Try with normalized source name
-    normalized = normalize_source_for_image_path(source_id)
-    normalized_path = img_dir / category / normalized
-    if subpath:
-        normalized_path = normalized_path / subpath
-
-    if normalized_path.exists() and normalized_path != direct_path:
-        return normalized_path
-
-    # For HAT-TG specifically, check if image is in TG/ directory
-    if source_id == "HAT-TG" and path_source == "TG":
-        tg_path = img_dir / category / "TG"
-        if subpath:
-            tg_path = tg_path / subpath
-        if tg_path.exists():
-            return tg_path
+    direct_rel = f"{category}/{rest}"
+    if direct_rel in img_index:
+        return expected_path, img_dir / direct_rel
+
+    # Try with normalized source name; when the written path already
+    # used the normalized source this candidate equals direct_rel and
+    # the check is skipped
+    if path_source != normalized:
+        normalized_rel = f"{category}/{normalized}/{subpath}" if subpath else f"{category}/{normalized}"
+        if normalized_rel in img_index:
+            return expected_path, img_dir / normalized_rel
 
     # Image not found
-    return None
+    return expected_path, None
 
 
 # =============================================================================
@@ -224,8 +244,11 @@ def find_image_references(data: Any, source: str, filename: str) -> List[ImageRe
     """
     Extract all image references from JSON data.
 
-    Recursively searches through the data structure for image paths
-    in 'href.path' fields.
+    Searches the data structure for image paths in 'href.path' fields.
+    The walk is iterative over an explicit stack, and context is reduced
+    to the enclosing key: the old closure merged a fresh context dict
+    per visited node, which dominated allocation on large files while
+    consumers only ever looked at 'parent_key'.
 
     Args:
         data: Parsed JSON data (dict, list, or primitive)
@@ -236,46 +259,79 @@ def find_image_references(data: Any, source: str, filename: str) -> List[ImageRe
         List of ImageRef objects found in the data
     """
     references = []
+    append_ref = references.append
+    stack = [(data, "")]
 
-    def extract_from_value(value: Any, parent_key: str = "", context: Dict = None) -> None:
-        """Recursively extract image references from a value."""
-        if context is None:
-            context = {}
+    while stack:
+        value, parent_key = stack.pop()
 
-        if isinstance(value, dict):
+        if type(value) is dict:
             # Check if this is an image reference
             if value.get("type") == "image":
                 href = value.get("href")
-                if isinstance(href, dict):
+                if type(href) is dict:
                     path = href.get("path")
-                    if isinstance(path, str) and path:
+                    if type(path) is str and path:
                         # Determine category from path
-                        category = path.split("/")[0] if "/" in path else "unknown"
-
-                        ref = ImageRef(
+                        append_ref(ImageRef(
                             source=source,
                             file=filename,
                             path=path,
-                            category=category,
-                            context={"parent_key": parent_key, **context},
-                        )
-                        references.append(ref)
+                            category=path.partition("/")[0] if "/" in path else "unknown",
+                            context={"parent_key": parent_key},
+                        ))
 
-            # Recursively search other dict values
+            # Search nested dict values
             for key, val in value.items():
-                new_context = {**context, "parent_key": key}
-                extract_from_value(val, key, new_context)
+                if type(val) in (dict, list):
+                    stack.append((val, key))
 
-        elif isinstance(value, list):
-            # Recursively search list items
-            for i, item in enumerate(value):
-                new_context = {**context, "index": i}
-                extract_from_value(item, parent_key, new_context)
+        elif type(value) is list:
+            # Search list items under the same enclosing key
+            for item in value:
+                if type(item) in (dict, list):
+                    stack.append((item, parent_key))
 
-    extract_from_value(data)
     return references
 
 
+# =============================================================================
+# Concurrent File Loading
+# =============================================================================
+
+def _read_and_parse(json_file: Path) -> Tuple[Path, Any, Optional[str]]:
+    """Read and parse one JSON file; errors are returned, not raised."""
+    try:
+        # orjson parses the raw bytes in C, skipping the text decode
+        raw = json_file.read_bytes()
+        if ORJSON_AVAILABLE:
+            return json_file, orjson.loads(raw), None
+        return json_file, json.loads(raw), None
+    except Exception as e:
+        return json_file, None, str(e)
+
+
+def _load_all(paths: List[Path], max_workers: int = 8) -> Iterator[Tuple[Path, Any, Optional[str]]]:
+    """
+    Read and parse JSON files in a thread pool.
+
+    Disk reads overlap with the CPU-bound validation in the consumer
+    instead of alternating with it. executor.map preserves input order,
+    so results stay deterministic.
+
+    Args:
+        paths: JSON files to load
+        max_workers: Thread pool width
+
+    Yields:
+        Tuples of (path, parsed data or None, error message or None)
+    """
+    if not paths:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        yield from executor.map(_read_and_parse, paths)
+
+
 # =============================================================================
 # Validation Functions
 # =============================================================================
@@ -284,6 +340,7 @@ def validate_image_reference(
     ref: ImageRef,
     img_dir: Path,
     logger: Optional[logging.Logger] = None,
+    img_index: Optional[Set[str]] = None,
 ) -> ValidationResult:
     """
     Validate a single image reference.
@@ -292,26 +349,26 @@ def validate_image_reference(
         ref: ImageRef to validate
         img_dir: Base img directory
         logger: Optional logger instance
+        img_index: Optional prebuilt index from build_image_index
 
     Returns:
         ValidationResult with validation details
     """
     log = logger or logging.getLogger(__name__)
 
-    # Get expected path for this source
-    expected_path = get_expected_image_path(ref.source, ref.path, img_dir)
-
-    # Get actual path (where image really is)
-    actual_path = get_actual_image_path(ref.source, ref.path, img_dir)
+    # Normalize once and resolve both paths in a single pass
+    normalized = normalize_source_for_image_path(ref.source)
+    expected_path, actual_path = resolve_image_paths(
+        ref.source, ref.path, img_dir, img_index, _normalized=normalized
+    )
 
     # Check for special cases (design decisions, not bugs)
-    normalized = normalize_source_for_image_path(ref.source)
     path_source = ref.path.split("/")[1] if "/" in ref.path else ""
 
     # Detect special cases
     if ref.source in config.IMAGE_PATH_SPECIAL_MAPPINGS and path_source == normalized:
         # This is a known special case (e.g., PS-A using PSA in paths)
-        if actual_path and actual_path.exists():
+        if actual_path is not None:
             return ValidationResult(
                 image_ref=ref,
                 status="special_case",
@@ -335,7 +392,7 @@ def validate_image_reference(
         )
 
     # Check if image exists
-    if actual_path and actual_path.exists():
+    if actual_path is not None:
         # Image found - valid
         if actual_path == expected_path:
             return ValidationResult(
@@ -373,6 +430,7 @@ def validate_source_images(
     data_dir: Path,
     img_dir: Path,
     logger: Optional[logging.Logger] = None,
+    img_index: Optional[Set[str]] = None,
 ) -> List[ValidationResult]:
     """
     Validate all image references for a single source.
@@ -382,6 +440,7 @@ def validate_source_images(
         data_dir: Base data_rework directory
         img_dir: Base img directory
         logger: Optional logger instance
+        img_index: Optional prebuilt index from build_image_index
 
     Returns:
         List of ValidationResult objects
@@ -389,41 +448,68 @@ def validate_source_images(
     log = logger or logging.getLogger(__name__)
     results = []
 
+    # Books reference the same image many times (covers, repeated
+    # plates); the outcome only depends on (source, path), so each
+    # distinct path is validated once and repeats reuse the result with
+    # their own ImageRef attached
+    seen: Dict[str, ValidationResult] = {}
+
     source_dir = data_dir / source_id
     if not source_dir.exists():
         log.warning(f"Source directory not found: {source_dir}")
         return results
 
-    # Find all JSON files in data/ subdirectory
+    # Find all JSON files in data/ subdirectory. One scandir pass over
+    # data/ collects the top-level JSON files and spots which known
+    # subdirectories exist, instead of four separate glob traversals
+    # each re-reading the directory.
     data_files = []
+    subdirs = []
 
-    # Main data directory
     main_data = source_dir / "data"
-    if main_data.exists():
-        data_files.extend(main_data.glob("*.json"))
-        data_files.extend(main_data.glob("bestiary/*.json"))
-        data_files.extend(main_data.glob("class/*.json"))
-        data_files.extend(main_data.glob("adventure/*.json"))
+    try:
+        with os.scandir(main_data) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in ("bestiary", "class", "adventure"):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    data_files.append(Path(entry.path))
+    except FileNotFoundError:
+        pass
+
+    for subdir in subdirs:
+        with os.scandir(subdir) as entries:
+            data_files.extend(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            )
 
     log.debug(f"Found {len(data_files)} JSON files for {source_id}")
 
-    # Process each JSON file
-    for json_file in data_files:
-        try:
-            import json
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+    # Process each JSON file; reads happen in a thread pool so the next
+    # file is already loading while the current one is validated
+    for json_file, data, error in _load_all(data_files):
+        if error is not None:
+            log.error(f"Error processing {json_file}: {error}")
+            continue
 
+        try:
             # Extract image references
             filename = json_file.name
             refs = find_image_references(data, source_id, filename)
 
             log.debug(f"Found {len(refs)} image references in {filename}")
 
-            # Validate each reference
+            # Validate each reference, reusing results for repeated paths
             for ref in refs:
-                validation = validate_image_reference(ref, img_dir, log)
-                results.append(validation)
+                cached = seen.get(ref.path)
+                if cached is None:
+                    cached = seen[ref.path] = validate_image_reference(ref, img_dir, log, img_index)
+                    results.append(cached)
+                else:
+                    results.append(replace(cached, image_ref=ref))
 
         except Exception as e:
             log.error(f"Error processing {json_file}: {e}")
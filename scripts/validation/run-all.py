@@ -6,38 +6,65 @@ This script orchestrates running all validation checks.
 """
 
 import argparse
+import importlib
 import json
+import os
 import subprocess
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
-
-
-# List of validation scripts to run
-VALIDATION_SCRIPTS = [
-    "check_pdf.py",
-    "check_links.py",
-    "check_source_purity.py",  # Проверка чистоты источников в data_rework/
-    # "check_images.py",  # Uncomment when implemented
-    # "check_cross_source.py",  # Uncomment when implemented
-    # "check_fluff.py",  # Uncomment when implemented
-    # "check_data_integrity.py",  # Uncomment when implemented
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_report(report: Dict[str, Any], path: Path) -> None:
+    """Serialize a report to disk, preferring orjson when available."""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+# Validation checks to run, as (module, entry function) pairs. Each
+# module exposes run_check(argv) returning its report dict, so the
+# orchestrator imports it in-process instead of paying an interpreter
+# start-up per script and re-parsing stdout as JSON.
+VALIDATION_SCRIPTS: List[Tuple[str, str]] = [
+    ("check_pdf", "run_check"),
+    ("check_links", "run_check"),
+    ("check_source_purity", "run_check"),  # Проверка чистоты источников в data_rework/
+    # ("check_images", "run_check"),  # Uncomment when implemented
+    # ("check_cross_source", "run_check"),  # Uncomment when implemented
+    # ("check_fluff", "run_check"),  # Uncomment when implemented
+    # ("check_data_integrity", "run_check"),  # Uncomment when implemented
 ]
 
 
-def run_script(script_name: str, script_dir: Path, args: List[str] = None) -> Dict[str, Any]:
+def run_script(module_name: str, entry: str, script_dir: Path, args: List[str] = None) -> Dict[str, Any]:
     """
-    Run a single validation script.
+    Run a single validation check.
+
+    Imports the module and calls its entry function in-process; falls
+    back to running the script via subprocess if the import fails.
 
     Args:
-        script_name: Name of the script to run
+        module_name: Module name of the check (e.g., "check_pdf")
+        entry: Name of the entry function returning the report dict
         script_dir: Directory containing scripts
-        args: Additional arguments to pass to script
+        args: Additional arguments to pass to the check
 
     Returns:
         Report dictionary
     """
+    script_name = f"{module_name}.py"
     script_path = script_dir / script_name
 
     if not script_path.exists():
@@ -47,6 +74,32 @@ def run_script(script_name: str, script_dir: Path, args: List[str] = None) -> Di
             "message": f"Script not found: {script_path}"
         }
 
+    # In-process path: one import instead of a cold interpreter start
+    try:
+        project_root = str(script_dir.parent.parent)
+        if project_root not in sys.path:
+            sys.path.insert(0, project_root)
+        module = importlib.import_module(f"scripts.validation.{module_name}")
+        run_check = getattr(module, entry)
+        report = run_check(args or [])
+        report.setdefault("script", script_name)
+        # check_pdf reports lowercase statuses; normalize so the
+        # summary aggregation sees OK/ERROR like the other checks
+        status = report.get("status")
+        if status == "success":
+            report["status"] = "OK"
+        elif status in ("error", "errors"):
+            report["status"] = "ERROR"
+        return report
+    except ImportError:
+        pass  # Модуль не импортируется — запускаем как подпроцесс
+    except Exception as e:
+        return {
+            "script": script_name,
+            "status": "ERROR",
+            "message": f"Failed to run check: {str(e)}"
+        }
+
     cmd = [sys.executable, str(script_path)]
     if args:
         cmd.extend(args)
@@ -85,7 +138,8 @@ def run_all(
     output_dir: Path = None,
     quick: bool = False,
     verbose: bool = False,
-    skip: List[str] = None
+    skip: List[str] = None,
+    jobs: int = 1
 ) -> Dict[str, Any]:
     """
     Run all validation scripts.
@@ -96,13 +150,14 @@ def run_all(
         quick: Quick mode (skip some checks)
         verbose: Verbose output for all scripts
         skip: List of scripts to skip
+        jobs: Number of checks to run concurrently
 
     Returns:
         Combined report
     """
     report = {
         "script": "run-all.py",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "status": "OK",
         "summary": {
             "total": 0,
@@ -122,52 +177,64 @@ def run_all(
     if verbose:
         common_args.append("--verbose")
 
-    # Run each script
-    for script_name in VALIDATION_SCRIPTS:
-        if skip and script_name in skip:
-            report["reports"].append({
-                "script": script_name,
-                "status": "SKIPPED",
-                "message": "Skipped by user request"
-            })
-            report["summary"]["skipped"] += 1
-            continue
-
-        if quick:
-            # Skip some scripts in quick mode
-            if script_name in ["check_cross_source.py", "check_fluff.py"]:
+    # Run the checks. They are independent, so with jobs > 1 they run
+    # concurrently in a thread pool — each check mostly waits on its own
+    # worker processes or disk I/O, so threads are enough. Results are
+    # collected in submission order to keep the combined report
+    # deterministic regardless of completion order.
+    futures = []
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for module_name, entry in VALIDATION_SCRIPTS:
+            script_name = f"{module_name}.py"
+
+            if skip and script_name in skip:
                 report["reports"].append({
                     "script": script_name,
                     "status": "SKIPPED",
-                    "message": "Skipped in quick mode"
+                    "message": "Skipped by user request"
                 })
                 report["summary"]["skipped"] += 1
                 continue
 
-        print(f"\n{'='*60}")
-        print(f"Running: {script_name}")
-        print(f"{'='*60}")
-
-        script_report = run_script(script_name, script_dir, common_args)
-        report["reports"].append(script_report)
-        report["summary"]["total"] += 1
-
-        # Save individual report if output_dir specified
-        if output_dir:
-            output_file = output_dir / f"{script_name}.json"
-            with open(output_file, "w") as f:
-                json.dump(script_report, f, indent=2)
-
-        # Update summary
-        status = script_report.get("status", "UNKNOWN")
-        if status == "OK":
-            report["summary"]["passed"] += 1
-        elif status == "ERROR":
-            report["summary"]["failed"] += 1
-            report["status"] = "ERROR"
-        elif status == "WARNING":
-            if report["status"] != "ERROR":
-                report["status"] = "WARNING"
+            if quick:
+                # Skip some scripts in quick mode
+                if script_name in ["check_cross_source.py", "check_fluff.py"]:
+                    report["reports"].append({
+                        "script": script_name,
+                        "status": "SKIPPED",
+                        "message": "Skipped in quick mode"
+                    })
+                    report["summary"]["skipped"] += 1
+                    continue
+
+            print(f"\n{'='*60}")
+            print(f"Running: {script_name}")
+            print(f"{'='*60}")
+
+            futures.append((script_name, executor.submit(
+                run_script, module_name, entry, script_dir, common_args
+            )))
+
+        for script_name, future in futures:
+            script_report = future.result()
+            report["reports"].append(script_report)
+            report["summary"]["total"] += 1
+
+            # Save individual report if output_dir specified
+            if output_dir:
+                _dump_report(script_report, output_dir / f"{script_name}.json")
+
+            # Update summary
+            status = script_report.get("status", "UNKNOWN")
+            if status == "OK":
+                report["summary"]["passed"] += 1
+            elif status == "ERROR":
+                report["summary"]["failed"] += 1
+                report["status"] = "ERROR"
+            elif status == "WARNING":
+                if report["status"] != "ERROR":
+                    report["status"] = "WARNING"
 
     return report
 
@@ -202,6 +269,18 @@ def main():
         action="append",
         help="Skip specific script (can be used multiple times)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        # sched_getaffinity respects CPU limits but is Linux-only;
+        # elsewhere fall back to the raw CPU count
+        default=(
+            len(os.sched_getaffinity(0))
+            if hasattr(os, "sched_getaffinity")
+            else (os.cpu_count() or 1)
+        ),
+        help="Number of checks to run concurrently (default: available CPUs)",
+    )
 
     args = parser.parse_args()
 
@@ -211,7 +290,8 @@ def main():
         args.output_dir,
         args.quick,
         args.verbose,
-        args.skip or []
+        args.skip or [],
+        args.jobs
     )
 
     # Print summary
@@ -227,8 +307,7 @@ def main():
     # Save combined report if output_dir specified
     if args.output_dir:
         output_file = args.output_dir / "run-all.json"
-        with open(output_file, "w") as f:
-            json.dump(report, f, indent=2)
+        _dump_report(report, output_file)
         print(f"\nCombined report saved to: {output_file}")
 
     # Exit with error code if any validation failed